@@ -43,7 +43,6 @@ import pydoxtools as pdx
 import pandas as pd
 box_cols = gu.box_cols
 from pydoxtools.settings import settings
-import torch
 import pathlib
 
 from tqdm import tqdm
@@ -52,7 +51,7 @@ tqdm.pandas()
 
 pdf_utils._set_log_levels()
 
-nlp_utils.device, torch.cuda.is_available(), torch.__version__
+nlp_utils.device
 
 # %% [markdown]
 # ## load pdf files
@@ -101,7 +100,9 @@ print(pdf_file)
 
 # %%
 page=18
-pdf = Document(pdf_file, page_numbers=[page])
+# table areas are detected page-by-page, table_area_workers=None distributes
+# this over all available CPU cores when analyzing more than one page
+pdf = Document(pdf_file, page_numbers=[page], table_area_workers=None)
 
 # %%
 hp = {'es1': 11.1, 'es2': 2.1, 'gs1': 11.1, 'gs2': 20.1}
@@ -136,7 +137,10 @@ adp = [{
 
 #print(pdf_file)
 #for p in pdfi.pages[1:]:
-boxes, box_levels = pdf.table_candidates, pdf.table_box_levels
+# table area detection results are cached on disk, so re-running this
+# notebook only recalculates them when the document or parameters change
+boxes = pdf.x("table_candidates", disk_cache=True)
+box_levels = pdf.x("table_box_levels", disk_cache=True)
 
 # %%
 vda.plot_box_layers(
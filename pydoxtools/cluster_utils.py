@@ -10,9 +10,12 @@ from typing import List, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn import cluster as cluster
+from scipy import sparse, spatial
+from scipy.sparse import csgraph
 from sklearn.metrics import pairwise_distances
 
+from . import math_utils
+
 # which columns in lists describe the bounding box coordinates (for readability/convenience)
 # pdf has 0,0: left, bottom
 # where x0, y0 left bottom and x1, y1 upper right
@@ -570,6 +573,42 @@ def calc_pairwise_matrix(pairwise_func: typing.Callable, data, diag=None, **kwar
     return dist
 
 
+def calc_pairwise_adjacency(
+        pairwise_func: typing.Callable, data, distance_threshold: float,
+        pair_idx: tuple[np.ndarray, np.ndarray] | None = None, **kwargs
+) -> sparse.csr_matrix:
+    """
+    Calculates a sparse adjacency matrix which connects all pairs of elements
+    in data which have a distance < distance_threshold.
+
+    In contrast to calc_pairwise_matrix the full (n x n) distance matrix never
+    gets created, the pairwise distances are only calculated for the lower triangle
+    and directly reduced to the list of connected pairs.
+
+    pair_idx: optionally only calculate the distances for these candidate pairs
+              (e.g. from alignement_candidate_pairs). All other pairs are
+              considered to be unconnected.
+    """
+    n = data.shape[0]
+    if pair_idx is None:
+        pair_idx = lower_triangle_indices_cached(n)
+    d_tri = pairwise_func(data, pair_idx, **kwargs)
+    connected = d_tri < distance_threshold
+    rows, cols = pair_idx[0][connected], pair_idx[1][connected]
+    return sparse.csr_matrix((np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n, n))
+
+
+def adjacency_cluster(adjacency: sparse.spmatrix) -> np.ndarray:
+    """
+    Groups elements which are (transitively) connected through an adjacency matrix.
+
+    This is equivalent to a "single-linkage" clustering where adjacency
+    holds all pairs with a distance below the clustering threshold.
+    """
+    _, labels = csgraph.connected_components(adjacency, directed=False)
+    return labels
+
+
 def get_default_extraction_params():
     # TODO: get better default parameters by doing some optimization
     es = 50  # alignement sensitivity
@@ -582,6 +621,79 @@ def get_default_extraction_params():
     }
 
 
+@math_utils.optional_njit(cache=True)
+def _pairwise_alignement_distance_kernel(
+        boxes: np.ndarray, pair_idx0: np.ndarray, pair_idx1: np.ndarray,
+        params: np.ndarray, use_params: np.ndarray
+) -> np.ndarray:
+    """
+    compiled version of the "va" & "ha" parts of pairwise_weighted_distance_combination.
+
+    params has the shape (2,4) with the parameters for "va" in the first row and
+    "ha" in the second row. use_params indicates which of the rows should be used.
+    """
+    n = pair_idx0.shape[0]
+    d = np.empty(n)
+    for k in range(n):
+        a = boxes[pair_idx0[k]]
+        b = boxes[pair_idx1[k]]
+        dist = np.inf
+        if use_params[0]:
+            # vertical alignement
+            y_gap = max(0.0, max(a[3], b[3]) - min(a[1], b[1]) - (a[3] - a[1]) - (b[3] - b[1]))
+            left = abs(a[0] - b[0])
+            middle = abs((a[0] + a[2]) - (b[0] + b[2])) / 2.0
+            right = abs(a[2] - b[2])
+            p = params[0]
+            dist = min(dist, p[0] * y_gap + min(left * p[1], middle * p[2], right * p[3]))
+        if use_params[1]:
+            # horizontal alignement
+            x_gap = max(0.0, max(a[2], b[2]) - min(a[0], b[0]) - (a[2] - a[0]) - (b[2] - b[0]))
+            bottom = abs(a[1] - b[1])
+            middle = abs((a[1] + a[3]) - (b[1] + b[3])) / 2.0
+            top = abs(a[3] - b[3])
+            p = params[1]
+            dist = min(dist, p[0] * x_gap + min(bottom * p[1], middle * p[2], top * p[3]))
+        d[k] = dist
+    return d
+
+
+def alignement_candidate_pairs(
+        boxes: np.ndarray, parameter_list: typing.Dict[str, typing.List], distance_threshold: float
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """
+    Finds all pairs of boxes which can have a distance < distance_threshold
+    for the "va" & "ha" distances of pairwise_weighted_distance_combination.
+
+    As the gap distances are always >= 0 two boxes can only be closer than
+    distance_threshold if at least one of their edge (or middle) coordinates
+    is closer than distance_threshold/weight. We search for these pairs using
+    a KD-tree for every coordinate which avoids calculating the distances for
+    all n*(n-1)/2 pairs.
+
+    returns: pair indices or None, if the candidates can not be narrowed down
+             for the given parameters.
+    """
+    if not parameter_list or not set(parameter_list) <= {'va', 'ha'}:
+        return None
+    coordinates = []
+    for key, (c0, c1) in (('va', (x0, x1)), ('ha', (y0, y1))):
+        if p := parameter_list.get(key, False):
+            if min(p[:4]) <= 0:  # alignement doesn't matter for these parameters...
+                return None
+            coordinates += [
+                (boxes[:, c0], p[1]),
+                ((boxes[:, c0] + boxes[:, c1]) / 2.0, p[2]),
+                (boxes[:, c1], p[3]),
+            ]
+    pairs = [
+        spatial.cKDTree(c[:, None]).query_pairs(r=distance_threshold / weight, output_type='ndarray')
+        for c, weight in coordinates
+    ]
+    pairs = np.unique(np.vstack(pairs), axis=0) if pairs else np.empty((0, 2), dtype=int)
+    return pairs[:, 1], pairs[:, 0]
+
+
 def pairwise_weighted_distance_combination(
         boxes: np.ndarray, pair_idx: np.ndarray,
         parameter_list: typing.Dict[str, typing.List]  # function parameters
@@ -599,6 +711,21 @@ def pairwise_weighted_distance_combination(
           by running it once with a list which tracks the maximum index that was called from it...
 
     """
+    if (math_utils.numba is not None) and parameter_list and set(parameter_list) <= {'va', 'ha'}:
+        # use the compiled kernel if we only need the alignement distances
+        params = np.zeros((2, 4))
+        use_params = np.zeros(2, dtype=np.bool_)
+        for i, key in enumerate(('va', 'ha')):
+            if p := parameter_list.get(key, False):
+                params[i] = p[:4]
+                use_params[i] = True
+        if use_params.any():
+            return _pairwise_alignement_distance_kernel(
+                np.ascontiguousarray(boxes),
+                np.ascontiguousarray(pair_idx[0]), np.ascontiguousarray(pair_idx[1]),
+                params, use_params
+            )
+
     boxes = boxes.copy()
     x_gap_dist = np.maximum(0, pairwise_box_gap_distance_along_axis_func(boxes, pair_idx, axis=0))
     y_gap_dist = np.maximum(0, pairwise_box_gap_distance_along_axis_func(boxes, pair_idx, axis=1))
@@ -675,6 +802,35 @@ def boundarybox_intersection_query(bbs, bbox, tol=1.0):
     return indices
 
 
+def boundarybox_intersection_counts(bbs: np.ndarray, areas: np.ndarray, tol=1.0) -> np.ndarray:
+    """
+    Counts for every area in *areas* how many boundingboxes from *bbs* intersect
+    with it. This gives the same results as calling boundarybox_intersection_query
+    for every single area.
+
+    Instead of testing all pairs of boxes and areas we sweep over the boxes sorted by
+    their left border. This way only boxes which start left of the right
+    border of an area need to be checked for an intersection.
+
+    :param bbs: array of boundary boxes (x0,y0,x1,y1)
+    :param areas: array of search areas (x0,y0,x1,y1)
+    :param tol: search tolerance (with respect to a single dimension)
+    :return: number of intersecting boxes for each area
+    """
+    counts = np.zeros(len(areas), dtype=int)
+    if len(bbs) == 0:
+        return counts
+    bbs = bbs[np.argsort(bbs[:, x0], kind="stable")]
+    # all boxes before these indices have x0 < area.x1 + tol
+    sweep_ends = np.searchsorted(bbs[:, x0], areas[:, x1] + tol, side="left")
+    for i, (area, end) in enumerate(zip(areas, sweep_ends)):
+        candidates = bbs[:end]
+        counts[i] = np.count_nonzero(
+            (candidates[:, y1] > (area[y0] - tol)) & (candidates[:, y0] < (area[y1] + tol))
+            & (candidates[:, x1] > (area[x0] - tol)))
+    return counts
+
+
 # TODO: check in different location whether it makes sense that
 #       we use a custom distance function in order to improve clustering
 # TODO: directly hand over the distance matrix for clarity?...
@@ -686,15 +842,21 @@ def distance_cluster(data: np.ndarray = None,
     """
     This function takes a distance function specified by either:
     "distance_func" or "pairwise_distance_func" and uses them in oder to
-    calculate a distance matrix which then gets used for an Agglomerative clustering
-    algorithm.
+    calculate a distance matrix which then gets used for a "single-linkage"
+    clustering: all elements which are (transitively) closer than
+    distance_threshold end up in the same group.
+
+    The clustering itself is done by finding the connected components
+    of the adjacency matrix (distance < distance_threshold) which is a lot faster than
+    a full agglomerative clustering and results in the same groups.
 
     TODO: replace all occurences of clustering with this function
     clusters "box"-data according to a certain distance function
 
-    TOOD: get rid of "AgglomerativeClustering by a custom function...
-
     TODO: only allow our vectorized_distance_functions
+
+    returns: (labels, distances) where distances are the distances between all
+             pairs of elements which were connected.
     """
     if pairwise_distance_func:
         # we can set the diagonal of the pairwise distance matrix to 0
@@ -704,21 +866,18 @@ def distance_cluster(data: np.ndarray = None,
         distance_matrix = pairwise_distances(data, metric=distance_func)
 
     if len(distance_matrix) > 1:
-        # TODO: replace with our own clustering function
-        #       as we already have the distance matrix, this shouldn't be too difficult...
-        res = cluster.AgglomerativeClustering(
-            n_clusters=None,
-            linkage="single",  # {‘ward’, ‘complete’, ‘average’, ‘single’}, default=’ward’
-            # we are choosing "manhattan" distance as we want to put emphasis on vertical/horizonal lines
-            metric="precomputed",  # “euclidean”, “l1”, “l2”, “manhattan”, “cosine”, or “precomputed”
-            connectivity=None,  # to make calculations faster
-            compute_full_tree=True,  # has to be true when used together with distance_threshold
-            distance_threshold=distance_threshold
-        ).fit(distance_matrix)
+        # we only need to look at the lower triangle as the matrix is symmetric
+        tri_idx = lower_triangle_indices_cached(len(distance_matrix))
+        d_tri = distance_matrix[tri_idx]
+        connected = d_tri < distance_threshold
+        adjacency = sparse.csr_matrix(
+            (np.ones(connected.sum(), dtype=bool), (tri_idx[0][connected], tri_idx[1][connected])),
+            shape=distance_matrix.shape)
+        labels = adjacency_cluster(adjacency)
     else:
         return [0], [0.]
 
-    return res.labels_, res.distances_
+    return labels, np.sort(d_tri[connected])
 
 
 # TODO: generalize this method to more dimensions in order to be able
@@ -766,6 +925,8 @@ def merge_bbox_groups(df: pd.DataFrame, group_labels: str, **kwargs) -> pd.DataF
             g[:, :2].min(0),
             g[:, 2:].max(0),
         )) for g in bb_groups],
-        columns=["x0", "y0", "x1", "y1"])
+        columns=["x0", "y0", "x1", "y1"],
+        # keep the precision of the input boxes (e.g. float32)
+        dtype=np.result_type(*df[box_cols].dtypes))
     merged_bboxes['num'] = group_sizes
     return merged_bboxes
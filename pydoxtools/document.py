@@ -1,20 +1,21 @@
 from __future__ import annotations  # this is so, that we can use python3.10 annotations..
 
+import concurrent.futures
 import functools
+import hashlib
 import io
 import json
 import logging
 import mimetypes
 import re
 import tempfile
+import threading
 from functools import cached_property
 from pathlib import Path
 from typing import IO, Protocol, Any, Callable
-from urllib.parse import urlparse
 
 import PIL
 import dask.bag
-import langdetect
 import networkx
 import numpy as np
 import pandas as pd
@@ -39,7 +40,8 @@ from .extract_objects import EntityExtractor
 from .extract_ocr import OCRExtractor
 from .extract_pandoc import PandocLoader, PandocConverter, PandocToPdxConverter
 from .extract_spacy import (SpacyOperator, extract_spacy_token_vecs, get_spacy_embeddings, extract_noun_chunks,
-                            ExtractRelationships, build_document_graph, CoreferenceResolution)
+                            ExtractRelationships, build_document_graph, CoreferenceResolution, stack_vectors,
+                            spacy_vectorizer, batch_spacy_docs)
 from .extract_tables import ListExtractor, TableCandidateAreasExtractor
 from .extract_textstructure import (DocumentElementFilter, text_boxes_from_elements,
                                     TitleExtractor, SectionsExtractor, extract_text_elements)
@@ -54,33 +56,75 @@ from .pdf_utils import PDFFileLoader, PDFImageRenderer
 logger = logging.getLogger(__name__)
 
 
-def is_url(url):
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except ValueError:
-        return False
+def is_url(url) -> bool:
+    """cheap check whether fobj is an http(s) url which we can download"""
+    return isinstance(url, str) and url.startswith(("http://", "https://"))
+
+
+def may_be_path(fobj: str | Path) -> bool:
+    """check without touching the filesystem whether fobj could be a path.
+    Strings with line breaks or which are longer than the maximum path length are
+    text content, so we can skip the stat() call for them."""
+    return isinstance(fobj, Path) or (len(fobj) < 4096 and "\n" not in fobj)
+
+
+def short_repr(fobj: Any, max_len: int = 10) -> str:
+    """short identifier for (potentially large) document sources such as
+    strings, bytes, paths or file objects"""
+    if isinstance(fobj, (str, bytes)):
+        return str(fobj[-max_len:])
+    elif isinstance(fobj, Path):
+        return str(fobj)
+    return str(getattr(fobj, "name", type(fobj).__name__))
+
+
+# reuse connections when loading many documents from the same host. requests.Session
+# is not thread-safe, so every thread (e.g. of Document.load_many) gets its own session.
+_http_sessions = threading.local()
+
+
+def get_http_session() -> requests.Session:
+    """the http session of the current thread"""
+    if (session := getattr(_http_sessions, "session", None)) is None:
+        session = _http_sessions.session = requests.Session()
+    return session
+
+
+def download_url(url: str, timeout: float = 30) -> bytes:
+    """download the content of a url into memory. The request times out
+    instead of blocking forever on unresponsive servers."""
+    response = get_http_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+
+# patterns are compiled once on import. Link & image patterns only search inside of
+# brackets, because patterns such as r'\[.*\]\(.*\)' backtrack quadratically
+# on long lines with many brackets
+_markdown_patterns = [re.compile(p, re.MULTILINE) for p in (
+    r'\*{1,2}[^*]+\*{1,2}',  # Bold or italic: *text* or **text**
+    r'#{1,6}\s',  # Headers: # text
+    r'\[[^\]\n]*\]\([^)\n]*\)',  # Links: [text](url)
+    r'!\[[^\]\n]*\]\([^)\n]*\)',  # Images: ![text](url)
+    r'`[^`]+`',  # Inline code: `code`
+    r'^\s{0,3}>\s',  # Blockquotes: > text
+    r'^\s{0,3}[-*+]\s',  # Unordered lists: - text or * text or + text
+    r'^\s{0,3}\d+\.\s',  # Ordered lists: 1. text
+    r'^\s{0,3}(```|~~~)',  # Code blocks: ``` or ~~~
+    r'\*\*\*|---|___',  # Horizontal rules: *** or --- or ___
+)]
+_html_pattern = re.compile(r'<!DOCTYPE html.*?>', re.IGNORECASE | re.DOTALL)
+_xml_pattern = re.compile(r'<\?xml.*?\?>', re.IGNORECASE | re.DOTALL)
+_mediawiki_pattern = re.compile(r'<mediawiki xmlns="http://www.mediawiki.org/xml/export-.*?"',
+                                re.IGNORECASE | re.DOTALL)
 
 
 def contains_markdown(text: str | bytes) -> bool:
     text = force_decode(text)
 
-    markdown_patterns = [
-        r'\*{1,2}[^*]+\*{1,2}',  # Bold or italic: *text* or **text**
-        r'#{1,6}\s',  # Headers: # text
-        r'\[.*\]\(.*\)',  # Links: [text](url)
-        r'!\[.*\]\(.*\)',  # Images: ![text](url)
-        r'`[^`]+`',  # Inline code: `code`
-        r'^\s{0,3}>\s',  # Blockquotes: > text
-        r'^\s{0,3}[-*+]\s',  # Unordered lists: - text or * text or + text
-        r'^\s{0,3}\d+\.\s',  # Ordered lists: 1. text
-        r'^\s{0,3}(```|~~~)',  # Code blocks: ``` or ~~~
-        r'\*\*\*|---|___',  # Horizontal rules: *** or --- or ___
-    ]
-
     match_count = 0
-    for pattern in markdown_patterns:
-        if re.search(pattern, text, re.MULTILINE):
+    for pattern in _markdown_patterns:
+        if pattern.search(text):
             match_count += 1
             if match_count >= 3:
                 return True
@@ -89,11 +133,8 @@ def contains_markdown(text: str | bytes) -> bool:
 
 
 def is_html_or_xml(file_content):
-    html_pattern = re.compile(r'<!DOCTYPE html.*?>', re.IGNORECASE | re.DOTALL)
-    xml_pattern = re.compile(r'<\?xml.*?\?>', re.IGNORECASE | re.DOTALL)
-
-    is_html = bool(html_pattern.search(file_content))
-    is_xml = bool(xml_pattern.search(file_content))
+    is_html = bool(_html_pattern.search(file_content))
+    is_xml = bool(_xml_pattern.search(file_content))
 
     if is_html:
         return 'text/html'
@@ -104,9 +145,7 @@ def is_html_or_xml(file_content):
 
 
 def detect_xml_type(file_content):
-    mediawiki_pattern = re.compile(r'<mediawiki xmlns="http://www.mediawiki.org/xml/export-.*?"',
-                                   re.IGNORECASE | re.DOTALL)
-    if bool(mediawiki_pattern.search(file_content)):
+    if bool(_mediawiki_pattern.search(file_content)):
         return "mediawiki"
     else:
         return "application/xml"
@@ -146,14 +185,57 @@ class DocumentBagType(Protocol):
     def apply(self, questions: list[str]) -> list[str]: ...
 
 
+def merge_keywords(**keywords) -> set[str]:
+    """merge several collections of keywords into a single set"""
+    merged = set()
+    for kw in keywords.values():
+        if isinstance(kw, str):
+            merged.add(kw)
+        elif kw is not None:
+            merged.update(kw)
+    merged.discard("")
+    return merged
+
+
+# lookup table for all code points which python treats as whitespace in str.split().
+# Code points outside of the table get mapped to its last entry (no whitespace).
+_whitespace_table = np.zeros(0x3002, dtype=bool)
+_whitespace_table[[c for c in range(0x3001) if chr(c).isspace()]] = True
+
+
+def count_words(text: str) -> int:
+    """count words in the same way as len(text.split()) but without creating
+    a list with all words"""
+    cp = np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+    is_space = _whitespace_table[np.minimum(cp, len(_whitespace_table) - 1)]
+    # a word starts wherever a non-whitespace character follows whitespace
+    # or the beginning of the text
+    starts = np.count_nonzero(is_space[:-1] & ~is_space[1:])
+    if len(is_space) and not is_space[0]:
+        starts += 1
+    return int(starts)
+
+
 def calculate_a_d_ratio(ft: str) -> float:
     """
     calculate the retaio of digits vs alphabeticsin a string
 
     can be between 0.0 (no letters) and 1.0 (all letters)
     """
-    alphas = sum(1 for c in ft if c.isalpha())
-    digits = sum(1 for c in ft if c.isdigit())
+    # count ascii characters on the code points with numpy and only
+    # fall back to python's unicode-aware str methods for non-ascii characters
+    cp = np.frombuffer(ft.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+    is_ascii = cp < 128
+    ascii_cp = cp[is_ascii]
+    lower_cp = ascii_cp | 0x20
+    alphas = int(np.count_nonzero((lower_cp >= 0x61) & (lower_cp <= 0x7a)))
+    digits = int(np.count_nonzero((ascii_cp >= 0x30) & (ascii_cp <= 0x39)))
+    if len(ascii_cp) < len(cp):
+        for c in map(chr, cp[~is_ascii].tolist()):
+            if c.isalpha():
+                alphas += 1
+            elif c.isdigit():
+                digits += 1
 
     if alphas or digits:
         ratio = alphas / (alphas + digits)
@@ -167,10 +249,8 @@ PDFDocumentStructureNodes = [
     extract_textstructure.PDFDocumentObjects()
     .input("valid_tables", "elements").out("document_objects").cache(allow_disk_cache=True)
     .docs("extracts a list of document objects such as tables, text boxes, figures, etc."),
-    FunctionOperator(lambda tables, elements: {
-        k: extract_textstructure.get_bbox_context(v.bbox, elements, v.page, "table")
-        for k, v in enumerate(tables)
-    }).input("elements", tables="valid_tables").out("table_context").cache()
+    FunctionOperator(extract_textstructure.get_tables_context)
+    .input("elements", tables="valid_tables").out("table_context").cache()
     .t(dict[int, str])
     .docs("Outputs a dictionary with the context of each table in the document"),
 ]
@@ -198,8 +278,15 @@ PDFNodes = [
     ListExtractor().cache()
     .input("line_elements").out("lists")
     .docs("Extracts lists from the document text elements"),
+    Configuration(table_area_workers=1)
+    .docs("Number of processes which are used to detect table areas page-by-page."
+          " Setting this to None will use all available CPU cores."),
+    Configuration(table_area_text_filter=False)
+    .docs("Sort out table areas which don't contain any text before extracting tables from them."
+          " Switched off by default, which keeps all detected areas as table candidates."),
     TableCandidateAreasExtractor()
-    .input("graphic_elements", "line_elements", "pages_bbox", "text_box_elements", "filename")
+    .input("graphic_elements", "line_elements", "pages_bbox", "text_box_elements", "filename",
+           max_workers="table_area_workers", filter_empty_areas="table_area_text_filter")
     .out("table_candidates", box_levels="table_box_levels").cache()
     .docs("Detects table candidates from the document elements"),
     FunctionOperator(lambda x: [t for t in x if t.is_valid])
@@ -224,7 +311,7 @@ PDFNodes = [
     .input("line_elements").out("text_box_elements").cache()
     .docs("Extracts a dataframe of text boxes from the document by grouping text elements")
     .t(pd.DataFrame),
-    FunctionOperator(lambda tb: "\n\n".join(te.text for te in tb)).t(str)
+    FunctionOperator(lambda tb: "\n\n".join([te.text for te in tb])).t(str)
     .input(tb="text_box_elements").out("full_text").cache()
     .docs("Extracts the full text from the document by grouping text elements"),
     TitleExtractor()
@@ -263,12 +350,12 @@ HTMLNodes = [
     FunctionOperator(lambda t, s: [t, s])
     .input(t="title", s="short_title").out("titles").cache()
     .docs("Extracts the titles from the html document"),
-    FunctionOperator(lambda x: {w.strip() for w in x.split(",")})
+    FunctionOperator(lambda x: {w for w in map(str.strip, x.split(",")) if w})
     .input(x="html_keywords_str").out("html_keywords").cache()
     .docs("Extracts explicitly given keywords from the html document"),
 
     ########### AGGREGATION ##############
-    FunctionOperator(lambda **kwargs: set(list_utils.flatten(kwargs.values())))
+    FunctionOperator(merge_keywords)
     .input("html_keywords", "textrank_keywords").out("keywords").cache()
     .docs("Aggregates the keywords from the html document and found by other algorithms"),
 ]
@@ -353,8 +440,11 @@ OCRNodes = [
 ]
 
 ClassifierNodes = [
+    Configuration(txtblock_classifier_quantize=False)
+    .docs("Use a dynamically int8-quantized version of the text block classifier. "
+          "Faster on CPUs, but results can differ slightly from the original model."),
     TextBlockClassifier()
-    .input("text_box_elements").out("addresses").cache()
+    .input("text_box_elements", quantize="txtblock_classifier_quantize").out("addresses").cache()
     .docs("Classifies the text elements into addresses, emails, phone numbers, etc. if possible."),
     PageClassifier()
     .input("page_templates").out("page_classifier").cache()
@@ -374,8 +464,8 @@ MetaDataNodes = [
     FunctionOperator(lambda full_text: 1 + (len(full_text) // 1000))
     .input("full_text").out("num_pages").cache().t(int)
     .docs("Number of pages in the document"),
-    FunctionOperator(lambda clean_text: len(clean_text.split()))
-    .input("clean_text").out("num_words").cache().t(int)
+    FunctionOperator(count_words)
+    .input(text="clean_text").out("num_words").cache().t(int)
     .docs("Number of words in the document"),
     FunctionOperator(lambda spacy_sents: len(spacy_sents))
     .input("spacy_sents").out("num_sents").no_cache().t(int)
@@ -383,8 +473,8 @@ MetaDataNodes = [
     FunctionOperator(calculate_a_d_ratio)
     .input(ft="full_text").out("a_d_ratio").cache()
     .docs("Letter/digit ratio of the text"),
-    FunctionOperator(lambda full_text: langdetect.detect(full_text))
-    .input("full_text").out("language").cache()
+    LanguageExtractor()
+    .input(text="full_text").out("language").cache()
     .default("unknown").docs(
         "Detect language of a document, return 'unknown' in case of an error"),
 
@@ -408,10 +498,17 @@ MetaDataNodes = [
 
 SpacyNodes = [
     Configuration(spacy_model_size="md", spacy_model="auto"),
+    Configuration(spacy_disable=["lemmatizer"])
+    .docs("spacy pipeline components which are not needed and won't be run. Noun chunks & "
+          "relationships need the tagger and parser, entities need ner."),
+    Configuration(spacy_n_process=1)
+    .docs("Number of processes which spacy uses to process the paragraphs of a document."
+          " -1 uses all available CPU cores."),
     SpacyOperator()
     .input(
         "language", "spacy_model",
-        full_text="full_text", model_size="spacy_model_size"
+        full_text="full_text", model_size="spacy_model_size", n_process="spacy_n_process",
+        disable="spacy_disable"
     ).out(doc="spacy_doc", nlp="spacy_nlp").cache()
     .docs("Spacy Document and Language Model for this document"),
     FunctionOperator(extract_spacy_token_vecs)
@@ -432,9 +529,9 @@ SpacyNodes = [
 KnowledgeGraphNodes = [
 
     # TODO: combine entities with coreferences
-    EntityExtractor().cache()
-    .input("spacy_doc").out("entities").cache()
-    .docs("Extract entities from text"),
+    EntityExtractor()
+    .input("spacy_doc").out("entities", "urls").cache()
+    .docs("Extract entities and urls from text"),
     # TODO: try to implement as much as possible from the constants below for all documentypes
     #       summary, urls, main_image, keywords, final_url, pdf_links, schemadata, tables_df
     # TODO: implement summarizer based on textrank
@@ -475,17 +572,20 @@ VectorizationNodes = [
     # TODO: make this configurable.. either we want
     #       to use spacy for this or we would rather have a huggingface
     #       model doing this...
+    Configuration(vector_dtype="float32")
+    .docs("dtype of the sentence & noun vectors. 'float16' halves their memory. The knn indexes"
+          " still calculate in float32, so this only changes the results very slightly."),
     FunctionOperator(
-        lambda x: dict(
-            sent_vecs=np.array([e.vector for e in x]),
+        lambda x, dtype: dict(
+            sent_vecs=stack_vectors(x, dtype),
             sent_ids=list(range(len(x)))))
-    .input(x="sents").out("sent_vecs", "sent_ids").cache()
+    .input(x="sents", dtype="vector_dtype").out("sent_vecs", "sent_ids").cache()
     .docs("Vectors for sentences & sentence_ids"),
     FunctionOperator(
-        lambda x: dict(
-            noun_vecs=np.array([e.vector for e in x]),
+        lambda x, dtype: dict(
+            noun_vecs=stack_vectors(x, dtype),
             noun_ids=list(range(len(x)))))
-    .input(x="noun_chunks").out("noun_vecs", "noun_ids").cache()
+    .input(x="noun_chunks", dtype="vector_dtype").out("noun_vecs", "noun_ids").cache()
     .docs(
         "Vectors for nouns and corresponding noun ids in order to find them in the spacy document"),
 
@@ -566,7 +666,7 @@ IndexNodes = [
     IndexExtractor()
     .input(vecs="noun_vecs", ids="noun_ids").out("noun_index").cache()
     .docs("Create an index for the nouns"),
-    FunctionOperator(lambda spacy_nlp: lambda x: spacy_nlp(x).vector)
+    FunctionOperator(spacy_vectorizer)
     .input("spacy_nlp").out("spacy_vectorizer").cache()
     .docs("Create a vectorizer function from spacy library."),
     KnnQuery().input(index="noun_index", idx_values="noun_chunks",
@@ -637,7 +737,7 @@ LLMNodes = [
         "In order to use openai-chatgpt, you can use 'gpt-3.5-turbo' or 'gpt-4'."
         "Additionally, we support models used by gpt4all library which"
         "can be run locally and most are available for commercial purposes. "
-        f"Currently available models are: {extract_nlpchat.gpt4_models()}"
+        "The currently available models are listed by pydoxtools.extract_nlpchat.gpt4_models()"
     ),
     extract_nlpchat.LLMChat().input(property_dict="to_dict", model_id="chat_model_id")
     .out("chat_answers").cache()
@@ -682,12 +782,13 @@ TextStructureNodes = [
     .input("document_objects").out("page_templates").cache()
     .docs("generates a text page with table & figure hints"),
 
-    FunctionOperator(lambda pt, ps: "".join(f"\n\n-------- {p} --------\n\n" + pt()[p] for p in ps))
-    .input(pt="page_templates", ps="page_set").out("page_templates_str").cache()
+    FunctionOperator(extract_textstructure.join_page_templates)
+    .input(page_templates="page_templates", pages="page_set").out("page_templates_str").cache()
     .t(str)
     .docs("Outputs a nice text version of the documents with annotated document objects"
           " such as page numbers, tables, figures, etc."),
-    FunctionOperator(lambda pt, ps: "".join(pt(exclude="all")[p] for p in ps))
+    FunctionOperator(lambda pt, ps: extract_textstructure.join_page_templates(
+        pt, ps, exclude="all", page_headers=False))
     .input(pt="page_templates", ps="page_set").out("page_templates_str_minimal").cache()
     .t(str)
 ]
@@ -796,6 +897,30 @@ document_operators = {
 }
 
 
+def _load_document(cls: type[Document], fobj, outputs: tuple[str, ...], kwargs: dict):
+    """create a document and calculate its outputs. This runs in the workers
+    of Document.load_many. Documents get pickled without their cache,
+    so we send the cached operator results back separately."""
+    doc = cls(fobj, **kwargs)
+    cached = {}
+    for name in outputs:
+        doc.x(name)
+        if (op := doc.x_funcs.get(name, None)) is not None and op in doc._cache:
+            cached[name] = doc._cache[op]
+    return doc, cached
+
+
+def _preload_spacy_models(cls: type[Document], languages: tuple[str, ...], kwargs: dict):
+    """load the spacy models for the given languages into the model cache of
+    this process, using the spacy configuration of the documents."""
+    if not languages:
+        return
+    doc = cls(" ", **{**kwargs, "document_type": "string"})
+    for language in languages:
+        SpacyOperator.load_model(
+            language, doc.x("spacy_model"), doc.x("spacy_model_size"), doc.x("spacy_disable"))
+
+
 class Document(Pipeline):
     """Basic document pipeline class to analyze documents from all kinds of formats.
 
@@ -1016,22 +1141,46 @@ operations and include the documentation there. Lambda functions should not be u
         self._page_numbers = page_numbers
         self._max_pages = max_pages
 
-        if ((self._document_type == "auto" and self.magic_library_available()) or
+        # TODO: this is an unfortunate position..  somehow should refactor documenttype detection,
+        #       fileloader and this here to download urls
+        if is_url(fobj) and (
+                (self._document_type == "auto" and self.magic_library_available()) or
                 self._document_type not in ["auto", "string", str(dict)]):
             try:
-                # TODO: this is an unfortunate position..  somehow should refactor documenttype detection,
-                #       fileloader and this here to download urls
-                if is_url(fobj):
-                    response = requests.get(fobj)
-                    self._fobj = response.content
-            except:
-                pass
-
-    @functools.lru_cache
+                self._fobj = download_url(fobj)
+            except requests.RequestException as e:
+                # fall back to using the url as a string document
+                logger.warning(f"could not download {fobj}: {e}")
+
+    # the pipeline key & the document type detection are cached on the instance instead of
+    # using functools.lru_cache. lru_cache on methods keeps a global reference to every
+    # Document and evicts results as soon as more than 128 documents are in use.
     def _pipeline_key(self):
-        return (self.__class__.__name__, str(self._configuration), self._fobj, self._source,
+        return self._cached_pipeline_key
+
+    @cached_property
+    def _cached_pipeline_key(self):
+        return (self.__class__.__name__, str(self._configuration), self._content_hash, self._source,
                 self._document_type, self._page_numbers, self._max_pages)
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # the detection result contains a copy of the raw content
+        state.pop("_document_type_detection", None)
+        return state
+
+    @cached_property
+    def _content_hash(self) -> str:
+        """md5 hash of the raw document content. This identifies a document in the disk cache
+        independent of where it was loaded from and avoids using (potentially large)
+        file contents as cache keys."""
+        content = self.raw_content
+        if isinstance(content, str):
+            content = content.encode("utf-8", errors="surrogatepass")
+        elif not isinstance(content, bytes):
+            content = str(content).encode("utf-8")
+        return hashlib.md5(content).hexdigest()
+
     @cached_property
     def fobj(self) -> bytes | str | Path | IO | dict | list | set:
         if self._fobj:
@@ -1086,8 +1235,18 @@ operations and include the documentation there. Lambda functions should not be u
             magic = False
         return magic
 
-    @functools.lru_cache
     def document_type_detection(self):
+        try:
+            return self._document_type_detection
+        except DocumentTypeError:
+            raise
+        except Exception as e:
+            raise DocumentTypeError(
+                f"could not detect the type of document: "
+                f"{short_repr(self._fobj if self._fobj is not None else self._source, 100)}") from e
+
+    @cached_property
+    def _document_type_detection(self):
         """
         This one here is actually important as it detects the
         type of data that we are going to use for out pipeline.
@@ -1115,7 +1274,7 @@ operations and include the documentation there. Lambda functions should not be u
             try:
                 if self._document_type == "string":
                     mimetype = "string"
-                elif Path(_fobj).is_file():  # check if we have an actual file here
+                elif may_be_path(_fobj) and Path(_fobj).is_file():  # check if we have an actual file here
                     detected_filepath = Path(_fobj)
                     buffer = load_raw_file_content(detected_filepath)
                     mimetype, _ = mimetypes.guess_type(detected_filepath, strict=False)
@@ -1213,10 +1372,105 @@ operations and include the documentation there. Lambda functions should not be u
         Returns:
             str: A string representation of the instance.
         """
-        if isinstance(self._source, (str, bytes)):
-            return f"{self.__module__}.{self.__class__.__name__}(source={self.source[-10:]})"
+        # this gets called when logging errors. So it shouldn't trigger loading the document
+        # (which self.source does if no source was given) and it mustn't fail itself.
+        source = self._source if self._source is not None else self._fobj
+        return f"{self.__module__}.{self.__class__.__name__}(source={short_repr(source)})"
+
+    @classmethod
+    def load_many(
+            cls,
+            sources: list[str | bytes | Path | IO],
+            outputs: tuple[str, ...] = ("full_text",),
+            max_workers: int = None,
+            executor: str = "process",
+            preload_spacy_languages: tuple[str, ...] = (),
+            **kwargs
+    ) -> list[Document]:
+        """
+        Load many documents in parallel.
+
+        Every source gets turned into a document and the given outputs are
+        calculated in a pool of workers. This is useful for local batches of documents.
+        For really large amounts of documents, use DocumentBag which distributes
+        the work using dask.
+
+        Args:
+            sources: list of file objects, paths or urls (everything that can be passed as fobj)
+            outputs: the outputs which should be calculated for every document.
+                     They need to be picklable when using processes.
+            max_workers: number of workers. Defaults to the number of CPUs
+            executor: "process" for CPU-bound documents such as pdfs, images and pandoc
+                      formats or "thread" for I/O-bound sources such as urls & html pages.
+            preload_spacy_languages: load the spacy models for these languages once
+                      when a worker starts, instead of when its first document needs them.
+            **kwargs: arguments which get passed to every Document
+
+        Returns:
+            list of documents in the same order as sources with their outputs already cached
+        """
+        preload_args = (cls, tuple(preload_spacy_languages), kwargs)
+        if executor == "process":
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_preload_spacy_models, initargs=preload_args)
+        elif executor == "thread":
+            # threads share the model cache of this process
+            _preload_spacy_models(*preload_args)
+            pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
         else:
-            return f"{self.__module__}.{self.__class__.__name__}(source={self.source})"
+            raise ValueError(f"unknown executor: {executor}, use 'process' or 'thread'")
+
+        outputs = tuple(outputs)
+        with pool:
+            futures = [pool.submit(_load_document, cls, fobj, outputs, kwargs) for fobj in sources]
+            docs = []
+            for future in futures:
+                doc, cached = future.result()
+                for name, op_res in cached.items():
+                    doc._cache[doc.x_funcs[name]] = op_res
+                docs.append(doc)
+        return docs
+
+    @classmethod
+    def batch_spacy(cls, docs: list[Document], batch_size: int = 64, n_process: int | None = None) -> list[Document]:
+        """
+        Run spacy on many documents at once.
+
+        Instead of calling the spacy model for every single document, the
+        paragraphs of all documents which use the same spacy model are streamed through
+        nlp.pipe in batches. The documents get segmented exactly like in the "spacy_doc"
+        operator, so the results are the same as calculating spacy_doc for every
+        document individually. They are placed in the cache of each document so that
+        spacy_doc (and everything that depends on it) doesn't get calculated again.
+
+        Args:
+            docs: the documents which should be processed
+            batch_size: number of paragraphs which are processed by spacy at once
+            n_process: number of processes for spacy. Defaults to the "spacy_n_process"
+                configuration of the documents.
+
+        Returns:
+            the same list of documents
+        """
+        groups: dict[tuple[int, int], tuple[Any, int, list[Document]]] = {}
+        for doc in docs:
+            spacy_operator = doc.x_funcs.get("spacy_doc", None)
+            if not isinstance(spacy_operator, SpacyOperator) or not spacy_operator._cache:
+                continue
+            nlp = SpacyOperator.load_model(
+                doc.x("language"), doc.x("spacy_model"),
+                doc.x("spacy_model_size"), doc.x("spacy_disable"))
+            doc_n_process = doc.x("spacy_n_process") if n_process is None else n_process
+            groups.setdefault((id(nlp), doc_n_process), (nlp, doc_n_process, []))[2].append(doc)
+
+        for nlp, group_n_process, group in groups.values():
+            spacy_docs = batch_spacy_docs(
+                nlp, [doc.x("full_text") for doc in group],
+                batch_size=batch_size, n_process=group_n_process)
+            for doc, spacy_doc in zip(group, spacy_docs):
+                doc._cache[doc.x_funcs["spacy_doc"]] = dict(doc=spacy_doc, nlp=nlp)
+
+        return docs
 
     """
     @property
@@ -3,12 +3,13 @@ from __future__ import annotations  # this is so, that we can use python3.10 ann
 import functools
 import json
 import logging
+import operator
 import pathlib
 import pickle
 import sys
 import typing
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import Enum
 from functools import cached_property
 from time import time
@@ -29,6 +30,14 @@ from .settings import settings
 
 logger = logging.getLogger(__name__)
 
+
+@functools.cache
+def get_pipeline_disk_cache() -> Cache:
+    """the disk cache shared by all pipelines. It gets opened once per process
+    instead of once for every pipeline instance."""
+    return Cache(settings.PDX_CACHE_DIR_BASE / "pipelines")
+
+
 if sys.version_info.minor < 10:
     slot_args = dict()
 else:
@@ -83,6 +92,25 @@ class DocumentElement:
         return (self.x0, self.y0, self.x1, self.y1)
 
 
+document_element_fields = tuple(f.name for f in fields(DocumentElement))
+_get_document_element_values = operator.attrgetter(*document_element_fields)
+_element_type_dtype = pd.CategoricalDtype(list(ElementType))
+
+
+def elements_to_dataframe(elements: typing.Iterable[DocumentElement]) -> pd.DataFrame:
+    """
+    convert a list of DocumentElements into a dataframe with one column per field.
+
+    pd.DataFrame(elements) would convert every element with dataclasses.asdict which
+    makes a deep copy of all attributes, including the (large) pdfminer objects.
+    """
+    df = pd.DataFrame.from_records(
+        [_get_document_element_values(e) for e in elements], columns=document_element_fields)
+    # a categorical "type" column makes filtering by element type a comparison of small integer codes
+    df["type"] = df["type"].astype(_element_type_dtype)
+    return df
+
+
 class TokenCollection:
     def __init__(self, tokens: list[spacy.tokens.Token]):
         self._tokens = tokens
@@ -328,8 +356,7 @@ class Pipeline(metaclass=MetaPipelineClassConfiguration):
 
     @cached_property
     def _disk_cache(self) -> dict[Operator, dict[str, Any]] | Cache:
-        cache = Cache(settings.PDX_CACHE_DIR_BASE / "pipelines")
-        return cache
+        return get_pipeline_disk_cache()
 
     @property
     def configuration(self):
@@ -677,15 +704,15 @@ supports pipeline flows:
                 res = op_res
                 source = self
 
-            # TODO: this can probably made more elegant
             # TODO: get rid of "dict" results...
             if isinstance(res, dict):
-                res = {operator_function._out_mapping[k]: v for k, v in res.items()
-                       if k in operator_function._out_mapping}
+                # only look up the requested output instead of remapping the entire output dict
+                output_key = operator_function._pipeline_out_mapping.get(operator_name, None)
             else:
                 # use first key of out_mapping for output if
                 # we only have a single return value
                 res = {next(iter(operator_function._out_mapping)): res}
+                output_key = operator_name
 
         except OperatorException as e:
             logger.error(f"Extraction error in {self}, '{operator_name}': {e}")
@@ -699,7 +726,7 @@ supports pipeline flows:
         #      it is a callable. (or use our own cache decorator)
 
         try:
-            final_result = res[operator_name]
+            final_result = res[output_key]
         except KeyError:
             raise OperatorOutputException(
                 f"Key '{operator_name}' does not exist in output dict of the Operator {operator_function}"
@@ -1,11 +1,11 @@
 from __future__ import annotations  # this is so, that we can use python3.10 annotations..
 
+import functools
 import logging
+import re
 import typing
 
-import langdetect
 import pandas as pd
-from transformers import AutoModelForSequenceClassification, pipeline, AutoTokenizer
 
 import pydoxtools.document_base
 from pydoxtools.operators_base import Operator
@@ -13,12 +13,37 @@ from pydoxtools.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# langdetect & transformers are imported inside the operators which need them, so that
+# importing pydoxtools.document stays fast for pipelines which never classify anything
+
+
+@functools.lru_cache(maxsize=1024)
+def detect_language(text: str) -> str:
+    """memoized language detection. Many documents share the same beginning
+    (e.g. templated reports), so we cache the results by text prefix."""
+    import langdetect
+
+    return langdetect.detect(text)
+
 
 class LanguageExtractor(Operator):
+    def __init__(self, max_chars: int = 4096):
+        """
+        max_chars: the language is detected from the first max_chars characters
+                   of the text only. A couple of KB are more than enough
+                   for reliable detection and keeps it fast for long documents.
+        """
+        super().__init__()
+        self._max_chars = max_chars
+
     def __call__(self, text) -> str:
-        text = text.strip()
+        # skip leading whitespace without copying the entire text
+        if start := re.search(r"\S", text):
+            text = text[start.start():start.start() + self._max_chars].strip()
+        else:
+            text = ""
         if text:
-            lang = langdetect.detect(text)
+            lang = detect_language(text)
         else:
             lang = "unknown"
         return lang
@@ -36,6 +61,8 @@ def zero_shot_classifier(
 
         pip install sentencepiece
     """
+    from transformers import AutoModelForSequenceClassification, pipeline, AutoTokenizer
+
     tokenizer = AutoTokenizer.from_pretrained(zero_shot_model_name)
     model = AutoModelForSequenceClassification.from_pretrained(zero_shot_model_name)
 
@@ -70,23 +97,49 @@ class PageClassifier(Operator):
         return _classify_page
 
 
+@functools.lru_cache
+def load_txtblock_classifier(quantize: bool = False):
+    """
+    load the text block classifier as a huggingface pipeline. The model gets cached,
+    so that we only need to load it once per process.
+
+    quantize: apply dynamic int8 quantization to the linear layers of the model.
+              This makes inference on CPUs a lot faster and the model smaller.
+    """
+    import torch
+    from transformers import AutoModelForSequenceClassification, pipeline, AutoTokenizer
+
+    tokenizer = AutoTokenizer.from_pretrained("bert-base-uncased")
+    model_name = "txtblockclassifier"
+    model_dir = settings.PDX_MODEL_DIR / model_name
+    if not model_dir.exists():
+        # TODO: download "any" model that we want from transformerss
+        logger.info(f"model {model_name} not found in pydoxtools models, download directly from transformers!")
+        model_dir = "xyntopia/tb_classifier"
+    # tokenizer_kwargs = {'padding': True, 'truncation': True, 'max_length': 512, 'return_tensors': 'pt'}
+    # TODO: optionally enable CUDA...
+    model = AutoModelForSequenceClassification.from_pretrained(model_dir, num_labels=2)  # .to("cuda")
+    if quantize:
+        model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return pipeline("text-classification", model=model, tokenizer=tokenizer)
+
+
 class TextBlockClassifier(Operator):
-    def __init__(self):
+    def __init__(self, batch_size: int = 256):
         super().__init__()
+        self._batch_size = batch_size
+
+    def __call__(
+            self,
+            text_box_elements: list[pydoxtools.document_base.DocumentElement],
+            quantize: bool = False
+    ) -> list[str]:
+        import torch
 
-    def __call__(self, text_box_elements: list[pydoxtools.document_base.DocumentElement]) -> list[str]:
-        tokenizer = AutoTokenizer.from_pretrained("bert-base-uncased")
-        model_name = "txtblockclassifier"
-        model_dir = settings.PDX_MODEL_DIR / model_name
-        if not model_dir.exists():
-            # TODO: download "any" model that we want from transformerss
-            logger.info(f"model {model_name} not found in pydoxtools models, download directly from transformers!")
-            model_dir = "xyntopia/tb_classifier"
-        # tokenizer_kwargs = {'padding': True, 'truncation': True, 'max_length': 512, 'return_tensors': 'pt'}
-        # TODO: optionally enable CUDA...
         # TODO: only extract "unique" addresses
-        model = AutoModelForSequenceClassification.from_pretrained(model_dir, num_labels=2)  # .to("cuda")
-        model = pipeline("text-classification", model=model, tokenizer=tokenizer)
+        model = load_txtblock_classifier(quantize)
         text = [t.text.strip() for t in text_box_elements]
-        res = [model([x], truncation=True, padding=True)[0]["label"] for x in text]
+        # classify all text blocks in padded batches instead of one forward pass per block
+        with torch.inference_mode():
+            res = [r["label"] for r in model(text, batch_size=self._batch_size, truncation=True, padding=True)]
         return [t for c, t in zip(res, text) if c == "address"]
@@ -10,14 +10,33 @@ from diskcache import Cache
 from .operators_base import Operator
 from .settings import settings
 
-cache = Cache(settings.PDX_CACHE_DIR_BASE / "chat_answers")
-
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-@cache.memoize()
+@functools.cache
+def get_chat_cache() -> Cache:
+    return Cache(settings.PDX_CACHE_DIR_BASE / "chat_answers")
+
+
+def memoize(func):
+    """memoize a function in the chat answers disk cache. In contrast to
+    Cache.memoize the cache only gets opened on the first call, not on import."""
+
+    @functools.cache
+    def memoized_func():
+        # use the same key as Cache.memoize would have, so that existing cache entries stay valid
+        return get_chat_cache().memoize(name=f"{func.__module__}.{func.__qualname__}")(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return memoized_func()(*args, **kwargs)
+
+    return wrapper
+
+
+@memoize
 def openai_chat_completion_with_diskcache(
         model_id: str, temperature: float,
         messages: tuple[dict[str, str], ...],
@@ -48,7 +67,7 @@ def openai_chat_completion_with_diskcache(
  'logit_bias': {}}
 
 
-@cache.memoize()
+@memoize
 def openai_chat_completion(msgs, model_id='gpt-3.5-turbo', max_tokens=256):
     completion = openai_chat_completion_with_diskcache(
         model_id=model_id, temperature=0.0, messages=msgs, max_tokens=max_tokens
@@ -74,7 +93,7 @@ def gpt4_models():
         return [""]
 
 
-@cache.memoize()
+@memoize
 def gpt4allchat(messages, model_id="ggml-mpt-7b-instruct", max_tokens=256, temperature=0.0):
     model = get_cached_gpt4model(model_id)
     task_msg = "\n".join([m['content'] for m in messages])
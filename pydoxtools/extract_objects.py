@@ -1,8 +1,8 @@
 from __future__ import annotations  # this is so, that we can use python3.10 annotations..
 
+from collections import defaultdict
 from typing import Any
 
-import pandas as pd
 from urlextract import URLExtract
 
 from pydoxtools.operators_base import Operator
@@ -16,7 +16,7 @@ urlextractor.update_when_older(7)  # updates when list is older that 7 days
 
 
 class EntityExtractor(Operator):
-    def __call__(self, spacy_doc) -> dict[str, list[str]]:
+    def __call__(self, spacy_doc) -> dict[str, dict[str, list[str]] | list[str]]:
         """TODO: add more entity extraction algorithms (e.g. hugginface)"""
         # TODO: add transformers as ner recognition as well:
         #       from transformers import pipeline
@@ -28,24 +28,26 @@ class EntityExtractor(Operator):
         # tokenizer= name
         # ner_pipe = pipeline(task="ner", model=model, tokenizer=tokenizer)
 
-        entities = []
-        spacy_entities = [(ent.text, ent.label_) for ent in spacy_doc.ents]
+        # group entities by their label
+        entity_groups = defaultdict(list)
+        for ent in spacy_doc.ents:
+            entity_groups[ent.label_].append(ent.text.strip())
 
-        entities.extend(spacy_entities)
-        entities = pd.DataFrame(entities, columns=["entity", "label"])
-        entities.entity = entities.entity.str.strip()
-        # entity_groups = entities.groupby('label').apply(lambda x: x.entity.value_counts().to_dict())
-        entity_groups = entities.groupby('label').entity.apply(list)
+        # reuse the tokenization from spacy for urls instead of scanning the text again
+        urls = [t.text for t in spacy_doc if t.like_url]
 
         return dict(
-            entities=entity_groups.to_dict()
+            entities=dict(sorted(entity_groups.items())),
+            urls=urls
         )
 
 
 def grouped_ner(self) -> dict[str, Any]:
     """Group labels from named entity recognition."""
-    groups = group_by([n[::-1] for n in self.ner])
-    return groups
+    groups = defaultdict(list)
+    for text, label in self.ner:
+        groups[label].append(text)
+    return dict(groups)
 
 
 def urls(self) -> list[str]:
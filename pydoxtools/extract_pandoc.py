@@ -1,5 +1,6 @@
 from __future__ import annotations  # this is so, that we can use python3.10 annotations..
 
+import functools
 import logging
 import mimetypes
 
@@ -61,6 +62,11 @@ def extract_list(elt):
         return output
 
 
+# there are only a few different document types, so we don't need to search the
+# mimetypes database for every single document
+guess_extension = functools.lru_cache(mimetypes.guess_extension)
+
+
 class PandocLoader(pydoxtools.operators_base.Operator):
     """
     Converts a string or a raw byte string into pandoc intermediate format.
@@ -74,7 +80,7 @@ class PandocLoader(pydoxtools.operators_base.Operator):
     ) -> "pandoc.types.Pandoc":
         if not pandoc_installed:
             raise RuntimeError("""Pandoc files can not be loaded, as pandoc is not installed""")
-        if ext := mimetypes.guess_extension(document_type):
+        if ext := guess_extension(document_type):
             ext = ext.strip(".")
         else:
             ext = document_type
@@ -1,6 +1,9 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
 import functools
 import itertools
 import logging
+import re
 import subprocess
 import typing
 from typing import Optional, Any
@@ -9,7 +12,6 @@ import networkx
 import numpy as np
 import pandas as pd
 import spacy
-import torch
 from spacy import Language
 from spacy.tokens import Doc, Token, Span
 
@@ -17,6 +19,7 @@ import pydoxtools.document_base
 from . import list_utils
 from .document_base import TokenCollection
 from .operators_base import Operator
+from .settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +40,59 @@ def extract_noun_chunks(spacy_doc) -> typing.List[TokenCollection]:
     return token_list
 
 
-def extract_spacy_token_vecs(spacy_doc) -> torch.Tensor | Any:
+def extract_spacy_token_vecs(spacy_doc) -> Any:
+    """token vectors of a spacy document (array or torch tensor, depending on the model)"""
     if spacy_doc.has_vector:
         return spacy_doc.tensor
     else:
         return spacy_doc._.trf_token_vecs
 
 
+def stack_vectors(spans: list[Span | TokenCollection], dtype: str | np.dtype = None) -> np.ndarray:
+    """stack the vectors of a list of spans into a single (n, dim) array.
+    The array gets allocated once and filled in place instead of collecting
+    all vectors in a list and copying them with np.array.
+
+    dtype: e.g. "float16" to halve the memory of the stacked vectors. Defaults
+           to the dtype of the vectors themselves.
+    """
+    if not spans:
+        return np.empty((0,), dtype=dtype or np.float32)
+    first = spans[0].vector
+    out = np.empty((len(spans), *first.shape), dtype=dtype or first.dtype)
+    out[0] = first
+    for i in range(1, len(spans)):
+        out[i] = spans[i].vector
+    return out
+
+
+def spacy_vectorizer(spacy_nlp: Language, cache_size: int = 4096) -> typing.Callable[[str], np.ndarray]:
+    """
+    create a function which calculates the spacy vector of a text.
+
+    If the model has static word vectors, a doc vector is the mean of its
+    token vectors. In that case we only need to run the tokenizer instead of the
+    entire pipeline. Otherwise (e.g. small or transformer models) the vector is
+    calculated from the outputs of the pipeline and we have to run all of it.
+    Vectors of texts which are queried repeatedly get cached.
+    """
+    if spacy_nlp.vocab.vectors.size > 0:
+        make_doc = spacy_nlp.make_doc
+    else:
+        make_doc = spacy_nlp
+
+    @functools.lru_cache(maxsize=cache_size)
+    def cached_vector(txt: str) -> np.ndarray:
+        return make_doc(txt).vector
+
+    def vectorize(txt: str) -> np.ndarray:
+        # hand out copies, so that modifying a vector (e.g. normalizing it
+        # in place) doesn't change the cached vector for later queries
+        return cached_vector(txt).copy()
+
+    return vectorize
+
+
 def get_spacy_embeddings(spacy_nlp):
     try:
         return spacy_nlp.components[0][1].model.transformer.embeddings.word_embeddings
@@ -68,20 +117,41 @@ def get_spacy_model_id(model_language, size="sm") -> Optional[str]:
         return f'xx_sent_ud_sm'
 
 
-@functools.lru_cache
-def load_cached_spacy_model(model_id: str) -> Language:
+@functools.lru_cache(maxsize=None)
+def init_spacy_device() -> bool:
+    """
+    switch spacy to the GPU once per process if settings.PDX_SPACY_PREFER_GPU is enabled.
+
+    This changes the global (thinc) device of spacy and has to happen before a model
+    gets loaded. prefer_gpu simply returns False if there is no GPU or spacy was installed
+    without cupy support, in which case we stay on the CPU.
+    """
+    if settings.PDX_SPACY_PREFER_GPU and spacy.prefer_gpu():
+        logger.info("using GPU for spacy models")
+        return True
+    return False
+
+
+@functools.lru_cache(maxsize=4)
+def load_cached_spacy_model(model_id: str, disable: tuple[str, ...] = ()) -> Language:
     """
     load spacy nlp model and in case of a transformer model add custom vector pipeline...
 
     we also make sure to cache the model for batch operations on documens.
+    The cache is limited to a couple of models, so that processing documents in many
+    different languages doesn't keep all of the (large) language models in memory.
+
+    disable: names of pipeline components which should not be run
+             (components that don't exist in the model are ignored).
     """
+    init_spacy_device()
     try:
         logger.info(f"loading spacy model: {model_id}")
-        nlp = spacy.load(model_id)
+        nlp = spacy.load(model_id, disable=disable)
     except OSError:  # model doesn't seem to be present, yet
         logger.info(f"failed, loading. trying to download spacy model: {model_id}")
         download_model(model_id)
-        nlp = spacy.load(model_id)
+        nlp = spacy.load(model_id, disable=disable)
 
     if model_id[-3:] == "trf":
         nlp.add_pipe('trf_vectors')
@@ -152,23 +222,78 @@ class TrfContextualVectors:
         return True
 
 
+def split_paragraphs(text: str) -> list[str]:
+    """split text into paragraphs while keeping the separating newlines at the end
+    of each paragraph so that "".join(split_paragraphs(text)) == text"""
+    return [p for p in re.split(r"(?<=\n\n)(?=[^\n])", text) if p]
+
+
+def batch_spacy_docs(spacy_nlp: Language, texts: typing.Iterable[str], batch_size=64, n_process=1) -> list[Doc]:
+    """
+    Process texts paragraph-by-paragraph with nlp.pipe and merge the
+    results back into a single spacy document per text.
+
+    This streams the texts through the model in batches instead of
+    having to process huge strings. The paragraphs of all texts share the
+    same stream, so several documents can be processed at once. Entities &
+    sentences never span several paragraphs anyways.
+
+    Transformer models with our "trf_vectors" pipeline attach their vectors through
+    user hooks which would get lost when merging docs, so they still process
+    every text at once.
+    """
+    texts = list(texts)
+    if "trf_vectors" in spacy_nlp.pipe_names:
+        return [spacy_nlp(text) for text in texts]
+
+    # texts with less than two paragraphs get processed as a whole
+    units = [paragraphs if len(paragraphs := split_paragraphs(text)) > 1 else [text] for text in texts]
+    if sum(map(len, units)) < 2:
+        n_process = 1  # not worth starting any processes for a single text
+    unit_docs = iter(spacy_nlp.pipe(
+        (u for text_units in units for u in text_units), batch_size=batch_size, n_process=n_process))
+    docs = []
+    for text_units in units:
+        if len(text_units) == 1:
+            docs.append(next(unit_docs))
+        else:
+            # we don't want any whitespace to be added, so that doc.text == text
+            docs.append(Doc.from_docs([next(unit_docs) for _ in text_units], ensure_whitespace=False))
+    return docs
+
+
+def batch_spacy_doc(spacy_nlp: Language, text: str, batch_size=64, n_process=1) -> Doc:
+    """
+    Process a long text paragraph-by-paragraph with nlp.pipe and merge the
+    results back into a single spacy document. (see batch_spacy_docs)
+    """
+    return batch_spacy_docs(spacy_nlp, [text], batch_size=batch_size, n_process=n_process)[0]
+
+
 class SpacyOperator(Operator):
+    @staticmethod
+    def load_model(language: str, spacy_model: str, model_size: str, disable: typing.Sequence[str] = ()) -> Language:
+        """choose the right spacy model for a document and load it"""
+        if spacy_model == "auto":
+            nlp_modelid = get_spacy_model_id(language, model_size)
+        else:
+            nlp_modelid = spacy_model
+
+        return load_cached_spacy_model(nlp_modelid, disable=tuple(disable))
+
     def __call__(
             self,
             full_text: str,
             language: str,
             spacy_model: str,
-            model_size: str
+            model_size: str,
+            n_process: int = 1,
+            disable: typing.Sequence[str] = ()
     ) -> typing.Dict[str, Language | Doc]:
         """Load a document using spacy"""
-        if spacy_model == "auto":
-            nlp_modelid = get_spacy_model_id(language, model_size)
-        else:
-            nlp_modelid = spacy_model
-
-        spacy_nlp = load_cached_spacy_model(nlp_modelid)
+        spacy_nlp = self.load_model(language, spacy_model, model_size, disable)
         return dict(
-            doc=spacy_nlp(full_text),
+            doc=batch_spacy_doc(spacy_nlp, full_text, n_process=n_process),
             nlp=spacy_nlp
         )
 
@@ -1,5 +1,6 @@
 from __future__ import annotations  # this is so, that we can use python3.10 annotations..
 
+import concurrent.futures
 import functools
 import hashlib
 import logging
@@ -18,7 +19,7 @@ import pydoxtools
 import pydoxtools.document_base
 import pydoxtools.operators_base
 from pydoxtools import cluster_utils as gu
-from pydoxtools.cluster_utils import pairwise_txtbox_dist, box_cols, y1, x0, x1, boundarybox_intersection_query
+from pydoxtools.cluster_utils import pairwise_txtbox_dist, box_cols, y1, x0, x1
 from pydoxtools.extract_html import extract_lists, extract_tables
 from pydoxtools.extract_textstructure import _line2txt
 from pydoxtools.operators_base import Operator
@@ -247,7 +248,7 @@ class ListExtractor(Operator):
         # search for lines that are part of lists
         # play around with this expression here: https://regex101.com/r/xrnKlm/1
         degree_search = r"^[\-\*∙•](?![\d\-]+\s?(?:(?:[°˚][CKF]?)|[℃℉]))"
-        df_le = pd.DataFrame(line_elements)
+        df_le = pydoxtools.document_base.elements_to_dataframe(line_elements)
         has_list_char = df_le.rawtext.str.strip().str.contains(degree_search, regex=True, flags=re.UNICODE)
         list_lines = df_le[has_list_char].rawtext.str.strip().to_frame()
 
@@ -994,8 +995,19 @@ class TableCandidateAreasExtractor(Operator):
             line_elements: list[pydoxtools.document_base.DocumentElement],
             pages_bbox,
             text_box_elements: list[pydoxtools.document_base.DocumentElement],
-            filename=None
+            filename=None,
+            max_workers: int | None = 1,
+            filter_empty_areas: bool = False
     ):
+        """
+        detect table areas from the graphic & text elements of a pdf
+
+        max_workers: number of processes used for the page-wise area detection.
+                     "1" runs everything in the current process, "None" uses
+                     all available CPU cores.
+        filter_empty_areas: sort out table areas which don't contain any text
+                     (see detect_table_area_candidates)
+        """
         # get minimum length for lines by searching for
         # the minimum height/width of a text box
         # we do this, because we assume that graphical elements should be at least this
@@ -1005,9 +1017,9 @@ class TableCandidateAreasExtractor(Operator):
         min_size = 5.0  # minimum size of a graphics element
         margin = 20  # margin of the page
         max_area_page_ratio = 0.4  # maximum area on a page to occupy by a graphics element
-        ge = pd.DataFrame(graphic_elements)
-        le = pd.DataFrame(line_elements)
-        text_box_elements = pd.DataFrame(text_box_elements)
+        ge = pydoxtools.document_base.elements_to_dataframe(graphic_elements)
+        le = pydoxtools.document_base.elements_to_dataframe(line_elements)
+        text_box_elements = pydoxtools.document_base.elements_to_dataframe(text_box_elements)
         pages = ge.p_num.unique()
         # we keep distance_threshold constant as the same effect can be gained
         # through tbe.area_detection_params but a lot more fine-grained as
@@ -1017,18 +1029,19 @@ class TableCandidateAreasExtractor(Operator):
         # merge everything with a distance of less than 10..
         distance_threshold = 10.0  # for table area candidates (TODO: parameterize?)
 
-        # detect table areas page-wise
-        box_iterations: dict[int, list[pd.DataFrame]] = {}
-        table_candidates: list[PDFTableCandidate] = []
+        # prepare elements page-wise
+        page_elements = {}
+        # calculate text box sizes once for all pages instead of copying
+        # and extending the text box dataframe for every page
+        tbe_sizes = pd.DataFrame({
+            "p_num": text_box_elements.p_num,
+            "w": text_box_elements.x1 - text_box_elements.x0,
+            "h": text_box_elements.y1 - text_box_elements.y0,
+        }).groupby("p_num").min()
         for p in pages:
-            tbe = text_box_elements.loc[text_box_elements.p_num==p].copy()
-            # do some calculations
-            # tbe['y_mean'] = tbe[['y0', 'y1']].mean(axis=1)
-            # tbe['x_mean'] = tbe[['x0', 'x1']].mean(axis=1)
-            tbe['w'] = tbe.x1 - tbe.x0
-            tbe['h'] = tbe.y1 - tbe.y0
-            min_elem_x = max(tbe.w.min(), min_size)
-            min_elem_y = max(tbe.h.min(), min_size)
+            tbe_w, tbe_h = tbe_sizes.loc[p] if p in tbe_sizes.index else (np.nan, np.nan)
+            min_elem_x = max(tbe_w, min_size)
+            min_elem_y = max(tbe_h, min_size)
             page_bbox = b = pages_bbox[p]
             page_area = b[2] * b[3]  # we can do this because the bounding box is always (0,0) at lower left
             df_ge = filter_out_small_graphics_elements(
@@ -1038,12 +1051,33 @@ class TableCandidateAreasExtractor(Operator):
                 page_bbox=page_bbox
             )
             df_le = le[le["p_num"] == p]
-            # TODO: make TableExtractionParameters configurable in document
-            table_areas, box_iterations[p] = detect_table_area_candidates(
-                self._tbe,
-                df_le, df_ge,
-                distance_threshold
-            )
+            page_elements[p] = (df_le, df_ge, page_bbox)
+
+        # table area detection is independent for every page, so we can
+        # distribute it over several processes. We only hand over the box coordinates
+        # to the workers in order to keep the pickling overhead low.
+        # TODO: make TableExtractionParameters configurable in document
+        le_boxes = [df_le[box_cols] for df_le, _, _ in page_elements.values()]
+        ge_boxes = [df_ge[box_cols] for _, df_ge, _ in page_elements.values()]
+        if max_workers == 1 or len(page_elements) < 2:
+            # the areas of pages are only cached in the current process, the
+            # memory of worker processes would simply get lost after every call
+            detect = functools.partial(
+                detect_table_area_candidates_cached, self._tbe, distance_threshold=distance_threshold,
+                filter_empty_areas=filter_empty_areas)
+            page_areas = list(map(detect, le_boxes, ge_boxes))
+        else:
+            detect = functools.partial(
+                detect_table_area_candidates, self._tbe, distance_threshold=distance_threshold,
+                filter_empty_areas=filter_empty_areas)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                page_areas = list(executor.map(detect, le_boxes, ge_boxes))
+
+        # create table candidates page-wise
+        box_iterations: dict[int, list[pd.DataFrame]] = {}
+        table_candidates: list[PDFTableCandidate] = []
+        for (p, (df_le, df_ge, page_bbox)), (table_areas, box_levels) in zip(page_elements.items(), page_areas):
+            box_iterations[p] = box_levels
             _table = (
                 PDFTableCandidate(
                     df_le, df_ge,
@@ -1066,12 +1100,14 @@ class TableCandidateAreasExtractor(Operator):
             text_box_elements: list[pydoxtools.document_base.DocumentElement],
             filename=None,
             images: dict[int, PIL.Image.Image] = None,
+            max_workers: int | None = 1,
+            filter_empty_areas: bool = False,
     ):
         # TODO: merge the common parts of the "use" method
         if self._method == "images":
             table_areas = []
-            df_le = pd.DataFrame(line_elements)
-            df_ge = pd.DataFrame(graphic_elements)
+            df_le = pydoxtools.document_base.elements_to_dataframe(line_elements)
+            df_ge = pydoxtools.document_base.elements_to_dataframe(graphic_elements)
             pages = df_le.p_num.unique()
             for page_num in pages:
                 img = images[page_num]
@@ -1093,18 +1129,61 @@ class TableCandidateAreasExtractor(Operator):
                                        line_elements,
                                        pages_bbox,
                                        text_box_elements,
-                                       filename)
+                                       filename,
+                                       max_workers,
+                                       filter_empty_areas)
+
+
+# in-process memory for table areas of pages that were already analyzed
+_page_table_areas_cache: dict[tuple, tuple[pd.DataFrame, list[pd.DataFrame]]] = {}
+_page_table_areas_cache_size = 128
+
+
+def detect_table_area_candidates_cached(
+        tbe: TableExtractionParameters,
+        df_le: pd.DataFrame, df_ge: pd.DataFrame,
+        distance_threshold: float,
+        filter_empty_areas: bool = False
+):
+    """
+    memoized version of detect_table_area_candidates.
+
+    The results are keyed by the box coordinates of the page elements and the
+    extraction parameters. This way, analyzing the same page several times (e.g. with
+    different page selections of the same document) only detects the areas once.
+    The cache lives in the memory of the current process, so it only gets used
+    if the table areas are detected in-process (max_workers == 1 or a single page).
+    The callers get copies of the cached frames and can modify them freely.
+    """
+    key = (
+        repr(tbe), distance_threshold, filter_empty_areas,
+        hashlib.md5(df_le[box_cols].to_numpy().tobytes()).hexdigest(),
+        hashlib.md5(df_ge[box_cols].to_numpy().tobytes()).hexdigest(),
+    )
+    if (res := _page_table_areas_cache.get(key)) is None:
+        res = detect_table_area_candidates(tbe, df_le, df_ge, distance_threshold, filter_empty_areas)
+        if len(_page_table_areas_cache) >= _page_table_areas_cache_size:
+            # drop the oldest entry
+            del _page_table_areas_cache[next(iter(_page_table_areas_cache))]
+        _page_table_areas_cache[key] = res
+    table_groups, box_iterations = res
+    return table_groups.copy(), [boxes.copy() for boxes in box_iterations]
 
 
 def detect_table_area_candidates(
         tbe: TableExtractionParameters,
         df_le, df_ge,
-        distance_threshold: float
+        distance_threshold: float,
+        filter_empty_areas: bool = False
 ):
     """
     Detect tables from elements such as textboxes & graphical elements.
     the function expects a range of parameters which need to be tuned.
 
+    filter_empty_areas: sort out areas which don't contain any text box from df_le
+        before the size/aspect ratio filters get applied. This is switched off by default,
+        so that all detected areas are kept as table candidates.
+
     TODO: sort out non-table area regions after every iteration and speed up subsequent
           table search iterations this way.. But optimize this on a recall-basis
           in order to make sure we don't sort out any valid tables...
@@ -1131,14 +1210,19 @@ def detect_table_area_candidates(
         raise ValueError("no area_detection_distance_func_params defined!")
     if len(boxes) > 1:  # merge boxes to table areas..
         for level, param_level in enumerate(tbe.area_detection_distance_func_params):
-            x = gu.calc_pairwise_matrix(
-                gu.pairwise_weighted_distance_combination, boxes.values, diag=0,
-                parameter_list=param_level
-            )
-
-            boxes["groups"], dist_m = gu.distance_cluster(
-                distance_matrix=x, distance_threshold=distance_threshold
+            # connect all boxes which are closer than distance_threshold and
+            # group them into connected areas (single linkage). We only calculate
+            # distances for boxes which are aligned closely enough to be connected at all.
+            # float32 precision is more than enough for pdf coordinates and halves the memory
+            # which has to be moved around in the pairwise distance calculations. The
+            # boxes themselves keep their original precision.
+            box_values = boxes[box_cols].to_numpy(dtype=np.float32)
+            adjacency = gu.calc_pairwise_adjacency(
+                gu.pairwise_weighted_distance_combination, box_values,
+                distance_threshold=distance_threshold, parameter_list=param_level,
+                pair_idx=gu.alignement_candidate_pairs(box_values, param_level, distance_threshold)
             )
+            boxes["groups"] = gu.adjacency_cluster(adjacency)
             # create new column with the type of group (hb,hm,ht,vb,vm,vt) and their labels
             boxes = gu.merge_bbox_groups(boxes, "groups")
             box_iterations.append(boxes)
@@ -1157,8 +1241,12 @@ def detect_table_area_candidates(
     # filter our empty groups
     # TODO: right now, we don't really know what would be a good filter...
     #       maybe do this by using an optimization approach
-    text_cell_num = boxes[box_cols].apply(lambda x: len(boundarybox_intersection_query(bbs=df_le, bbox=x)), axis=1)
-    boxes[text_cell_num > 0].copy()
+    if filter_empty_areas:
+        text_cell_num = gu.boundarybox_intersection_counts(
+            bbs=df_le[box_cols].to_numpy(copy=False), areas=boxes[box_cols].to_numpy(copy=False))
+        boxes = boxes[text_cell_num > 0].copy()
+        if boxes.empty:
+            return pd.DataFrame(), box_iterations
     table_groups: pd.DataFrame = _filter_boxes(
         boxes,
         min_area=tbe.min_table_area,
@@ -2,7 +2,6 @@ from __future__ import annotations  # this is so, that we can use python3.10 ann
 
 import operator
 import typing
-from dataclasses import asdict, fields
 
 import numpy as np
 import pandas as pd
@@ -20,26 +19,26 @@ def _line2txt(LTOBJ: typing.Iterable, size_hints=False):
     """
     extract text from pdfiner.six lineobj including size hints
 
-    TODO: speedup using cython/nuitka/numba
+    The text pieces get collected in a list and joined once at the end,
+    instead of concatenating strings character by character.
     """
-    txt = ""
+    if not size_hints:
+        return "".join([ch.get_text() for ch in LTOBJ if isinstance(ch, pdfminer.layout.LTText)])
+
+    parts = []
     last_size = 0
     for i, ch in enumerate(LTOBJ):
-        newtxt = ""
-        sizehint = ""
+        if isinstance(ch, pdfminer.layout.LTChar):
+            newsize = ch.size
+            if i > 0:
+                if newsize < last_size:
+                    parts.append("<s>")
+                elif newsize > last_size:
+                    parts.append("</s>")
+            last_size = newsize
         if isinstance(ch, pdfminer.layout.LTText):
-            newtxt = ch.get_text()
-        if size_hints:
-            if isinstance(ch, pdfminer.layout.LTChar):
-                newsize = ch.size
-                if i > 0:
-                    if newsize < last_size:
-                        sizehint = "<s>"
-                    elif newsize > last_size:
-                        sizehint = "</s>"
-                last_size = newsize
-        txt += sizehint + newtxt
-    return txt
+            parts.append(ch.get_text())
+    return "".join(parts)
 
 
 def docinfo(self) -> list[dict[str, str]]:
@@ -51,8 +50,8 @@ def num_pages(self) -> int:
     return len(self.pages)
 
 
-def pages(self) -> list[str]:
-    """automatically divide text into approx. pages"""
+def pages(self) -> list[list[str]]:
+    """automatically divide text into approx. pages with the words of every page"""
     page_word_size = 500
     words = self.full_text.split()
     # for i in range(len(words)):
@@ -60,6 +59,11 @@ def pages(self) -> list[str]:
     return pages
 
 
+def page_texts(self) -> list[str]:
+    """the text of the approx. pages from pages(), with the words of every page joined once"""
+    return [" ".join(words) for words in pages(self)]
+
+
 def mime_type(self) -> str:
     """
     type such as "pdf", "html" etc...  can also be the mimetype!
@@ -72,6 +76,9 @@ def mime_type(self) -> str:
 def extract_text_elements(text: str) -> list[document_base.DocumentElement]:
     # we should also make sure, if its possible or us to detect any sort of ASCII
     # or pandoc tables here...
+    # str.split is a single pass in C and about 10x faster than matching
+    # the blocks with a regular expression (e.g. re.finditer). It also keeps
+    # empty blocks, so the placeholder numbering stays stable.
     elements = [document_base.DocumentElement(
         type=document_base.ElementType.TextBox,
         text=tb,
@@ -97,32 +104,100 @@ class DocumentElementFilter(pydoxtools.operators_base.Operator):
         return df
 
 
+def _as_dataframe(elements: list[document_base.DocumentElement] | pd.DataFrame) -> pd.DataFrame:
+    """only convert elements into a dataframe if they aren't one already"""
+    return elements if isinstance(elements, pd.DataFrame) else document_base.elements_to_dataframe(elements)
+
+
+def _sort_into_groups(elements: pd.DataFrame, by: list[str]) -> tuple[pd.DataFrame, list[int], list[int]]:
+    """
+    sort elements by their group keys, so that every group becomes a contiguous
+    block of rows. Returns the sorted elements together with the start and end
+    row of every group. Like in a pandas groupby, rows with missing keys are dropped.
+    """
+    elements = elements.dropna(subset=by)
+    keys = [elements[b].to_numpy() for b in by]
+    order = np.lexsort(keys[::-1])  # lexsort is stable, so elements keep their order within a group
+    keys = [k[order] for k in keys]
+    if len(order):
+        new_group = np.logical_or.reduce([k[1:] != k[:-1] for k in keys])
+        starts = np.r_[0, np.flatnonzero(new_group) + 1].tolist()
+    else:
+        starts = []
+    ends = starts[1:] + [len(order)] if starts else []
+    return elements.iloc[order], starts, ends
+
+
+def _group_boxes_from_lines_w_bb(elements: pd.DataFrame, by: list[str]) -> pd.DataFrame:
+    # aggregate object from the same box and calculate new
+    # bounding boxes, also join the formatted text.
+    # Instead of a pandas groupby, we sort the lines by their group keys
+    # once and reduce the contiguous groups with numpy.
+    elements, starts, ends = _sort_into_groups(elements, by)
+
+    def reduce_column(col, ufunc):
+        values = elements[col].to_numpy()
+        return ufunc.reduceat(values, starts) if starts else values
+
+    # extract the texts of all line objects at once instead of group by group
+    line_texts = [_line2txt(line) if line else "" for line in elements.obj.to_numpy()]
+    raw_texts = elements.rawtext.tolist()
+    texts = []
+    for start, end in zip(starts, ends):
+        # use the text from the line objects wherever we were able to construct it
+        text = "".join(line_texts[start:end]) or "".join(raw_texts[start:end])
+        texts.append(text.strip())
+
+    bg = pd.DataFrame(dict(
+        x0=reduce_column("x0", np.minimum), y0=reduce_column("y0", np.minimum),
+        x1=reduce_column("x1", np.maximum), y1=reduce_column("y1", np.maximum),
+        # keep the column a string column, even if there are no boxes at all
+        text=np.array(texts, dtype=object)
+    ), index=pd.MultiIndex.from_arrays([elements[b].to_numpy()[starts] for b in by], names=by))
+    # remove empty box_groups
+    bg = bg[bg.text.str.len() > 0]
+    return bg
+
+
+def _group_sections(elements: pd.DataFrame, by: list[str]) -> dict[str, str]:
+    # join the texts of every section in one go instead of adding them up
+    # with a pandas "sum" which concatenates the strings one by one
+    elements, starts, ends = _sort_into_groups(elements.explode('sections'), by)
+    if not starts:
+        return {}
+    raw_texts = elements.rawtext.tolist()
+    sections = elements[by[0]].to_numpy()[starts].tolist()
+    first_box = np.minimum.reduceat(elements.boxnum.to_numpy(), starts)
+    return {
+        sections[i]: "".join(raw_texts[starts[i]:ends[i]])
+        for i in np.argsort(first_box, kind="stable").tolist()
+    }
+
+
+_group_aggregations = {
+    "boxes_from_lines_w_bb": _group_boxes_from_lines_w_bb,
+    "sections": _group_sections,
+}
+
+
 def group_elements(elements: pd.DataFrame, by: list[str], agg: str):
-    group = elements.groupby(by)
-    if agg == "boxes_from_lines_w_bb":
-        # aggregate object from the same box and calculate new
-        # bounding boxes, also join the formatted text
-        bg = group.agg(
-            x0=("x0", "min"), y0=("y0", "min"),
-            x1=("x1", "max"), y1=("y1", "max"),
-            tmp_text=("obj",
-                      lambda x: "".join(_line2txt(obj, size_hints=False) if obj else "" for obj in x.values)),
-            text=("rawtext", "sum")
-        )
-        # overlay text with tmp_text wherever we were able to construct a "tmp_text" object
-        tmp_text_selector = bg.tmp_text.str.len() > 0
-        bg.loc[tmp_text_selector, "text"] = bg.loc[tmp_text_selector, "tmp_text"]
-        bg.drop(columns=['tmp_text'])
-        # strip whitespace from boxes
-        bg["text"] = bg["text"].str.strip()
-        # remove empty box_groups
-        bg = bg[bg.text.str.len() > 0].copy()
-        return bg
-    elif "sections":
-        group = elements.explode('sections').groupby(*by)
-        df = group.agg(text=("rawtext", "sum"), order=("boxnum", "min")).sort_values("order")
-
-        return df["text"].to_dict()
+    """group elements by the columns in "by" using one of the aggregations
+    in _group_aggregations"""
+    try:
+        aggregate = _group_aggregations[agg]
+    except KeyError:
+        raise ValueError(f"unknown aggregation: {agg}, choose one of {list(_group_aggregations)}")
+    return aggregate(elements, by)
+
+
+def _group_text_boxes(line_elements: list[document_base.DocumentElement] | pd.DataFrame) -> pd.DataFrame:
+    """group text lines into a dataframe of text boxes with their bounding boxes and text"""
+    df = _as_dataframe(line_elements)
+    # page and box numbers are small integers, sorting them with the smallest
+    # possible integer type is faster. Columns with missing values stay as they are.
+    df = df.assign(**{k: pd.to_numeric(df[k], downcast="integer") for k in ('p_num', 'boxnum')
+                      if pd.api.types.is_integer_dtype(df[k])})
+    return group_elements(df, ['p_num', 'boxnum'], agg="boxes_from_lines_w_bb")
 
 
 def text_boxes_from_elements(line_elements: list[document_base.DocumentElement]) -> dict[str, pd.DataFrame | None]:
@@ -146,16 +221,18 @@ def text_boxes_from_elements(line_elements: list[document_base.DocumentElement])
     TODO: do some schema validation on the pandas dataframes...
     """
 
-    df = pd.DataFrame(line_elements)
-    bg = group_elements(df, ['p_num', 'boxnum'], agg="boxes_from_lines_w_bb")
-    tbs = bg.apply(lambda x: document_base.DocumentElement(
+    bg = _group_text_boxes(line_elements)
+    tbs = [document_base.DocumentElement(
         type=document_base.ElementType.TextBox,
-        text=x.text,
+        text=text,
         level=1,
-        p_num=x.name[0],
-        boxnum=x.name[1],
-        x0=x.x0, y0=x.y0, x1=x.x1, y1=x.y1,
-    ), axis=1).to_list()
+        p_num=p_num,
+        boxnum=boxnum,
+        x0=x0, y0=y0, x1=x1, y1=y1,
+    ) for p_num, boxnum, x0, y0, x1, y1, text in zip(
+        bg.index.get_level_values(0).tolist(), bg.index.get_level_values(1).tolist(),
+        bg.x0.tolist(), bg.y0.tolist(), bg.x1.tolist(), bg.y1.tolist(), bg.text.tolist()
+    )]
     return dict(text_box_elements=tbs)
 
 
@@ -165,7 +242,7 @@ class SectionsExtractor(pydoxtools.operators_base.Operator):
     """
 
     def __call__(self, elements: list[document_base.DocumentElement]):
-        df = pd.DataFrame(elements)
+        df = document_base.elements_to_dataframe(elements)
         bg = group_elements(df, ['sections'], agg="sections")
         return {"sections": bg}
 
@@ -182,14 +259,23 @@ class TitleExtractor(pydoxtools.operators_base.Operator):
     #TODO: use this for html and other kinds of text files as well...
     """
 
+    # below this number of lines we use a simple font size heuristic
+    # instead of fitting an IsolationForest
+    min_lines_for_outlier_detection = 50
+    # fixed seed for the IsolationForest, so that a document always gets the same titles
+    random_state = 0
+
     def __call__(self, line_elements):
-        line_elements = pd.DataFrame(line_elements)
+        line_elements = document_base.elements_to_dataframe(line_elements)
         dfl = self.prepare_features(line_elements)
+        # classify the lines only once and share the result between all outputs
+        is_outlier = dfl['outliers'].to_numpy() == -1
+        title_candidates = dfl[is_outlier & (dfl['wordcount'].to_numpy() < 10)]
         return dict(
-            titles=self.titles(dfl),
-            side_titles=self.side_titles(dfl),
-            side_content=self.side_content(dfl),
-            main_content=self.normal_content(dfl)
+            titles=self.titles(title_candidates),
+            side_titles=self.side_titles(title_candidates, dfl),
+            side_content=self.side_content(dfl, is_outlier),
+            main_content=self.normal_content(dfl, is_outlier)
         )
 
     def prepare_features(self, df_le: pd.DataFrame) -> pd.DataFrame:
@@ -205,19 +291,23 @@ class TitleExtractor(pydoxtools.operators_base.Operator):
         dfl = df_le.dropna(axis=1).copy()
         # get font with largest size to characterize line
         # TODO: this can probably be made better..  (e.g. only take the font of the "majority" content)
-        dfl[['font', 'size', 'color']] = dfl.font_infos.apply(
-            lambda x: pd.Series(asdict(max(x, key=operator.attrgetter("size"))))
-        )
+        line_fonts = [max(x, key=operator.attrgetter("size")) for x in dfl.font_infos.values]
+        dfl['font'] = [f.name for f in line_fonts]
+        dfl['size'] = np.fromiter((f.size for f in line_fonts), dtype=float, count=len(line_fonts))
+        dfl['color'] = [f.color for f in line_fonts]
 
         # generate some more features
         dfl['text'] = dfl.rawtext.str.strip()
         dfl = dfl.loc[dfl.text.str.len() > 0].copy()
         dfl['length'] = dfl.text.str.len()
         dfl['wordcount'] = dfl.text.str.split().apply(len)
-        dfl['vertical'] = dfl.obj.apply(lambda x: isinstance(x, LTTextLineVertical))
+        dfl['vertical'] = np.fromiter(
+            (isinstance(o, LTTextLineVertical) for o in dfl.obj.values), dtype=bool, count=len(dfl))
 
-        dfl = dfl.join(pd.get_dummies(dfl.font, prefix="font"))
-        dfl = dfl.join(pd.get_dummies(dfl.font, prefix="color"))
+        # integer codes instead of one-hot columns keep the feature matrix small,
+        # the trees of the IsolationForest can split on them just as well
+        dfl['font_code'] = pd.Categorical(dfl.font).codes
+        dfl['color_code'] = pd.Categorical(dfl.color).codes
 
         features = set(dfl.columns) - {'obj', 'linewidth', 'non_stroking_color', 'stroking_color', 'stroke',
                                        'fill', 'evenodd', 'type', 'text', 'font_infos', 'font', 'rawtext',
@@ -226,34 +316,40 @@ class TitleExtractor(pydoxtools.operators_base.Operator):
         # detect outliers to isolate titles and other content from "normal"
         # content
         # TODO: this could be subject to some hyperparameter optimization...
-        df = dfl[list(features)]
-        clf = IsolationForest()  # contamination=0.05)
+        if len(dfl) < self.min_lines_for_outlier_detection:
+            # fitting a forest on a handful of lines doesn't tell us much,
+            # simply mark lines with unusually large fonts as outliers
+            dfl['outliers'] = np.where(dfl['size'] > dfl['size'].quantile(0.9), -1, 1)
+            return dfl
+
+        # the trees work on float32 internally, so we convert the features only once
+        # (sorted, because the order of a set of strings changes between python processes)
+        df = dfl[sorted(features)].to_numpy(dtype=np.float32)
+        clf = IsolationForest(random_state=self.random_state)  # contamination=0.05)
         clf.fit(df)
         dfl['outliers'] = clf.predict(df)
 
         return dfl
 
-    def titles(self, dfl) -> typing.List:
-        # titles = l.query("outliers==-1")
-        titles = dfl.query("outliers==-1 and wordcount<10")
-        titles = titles[titles['size'] >= titles['size'].quantile(0.75)]
+    def titles(self, title_candidates: pd.DataFrame) -> typing.List:
+        sizes = title_candidates['size']
+        titles = title_candidates[sizes.to_numpy() >= sizes.quantile(0.75)]
         return titles.get("text", pd.Series(dtype=object)).to_list()
 
-    def side_titles(self, dfl) -> pd.DataFrame:
+    def side_titles(self, title_candidates: pd.DataFrame, dfl: pd.DataFrame) -> pd.DataFrame:
         # TODO: what to do with side-titles?
-        side_titles = dfl.query("outliers==-1 and wordcount<10")
-        side_titles = side_titles[side_titles['size'] > dfl['size'].quantile(0.75)]
+        side_titles = title_candidates[title_candidates['size'].to_numpy() > dfl['size'].quantile(0.75)]
         # titles = titles[titles['size']>titles['size'].quantile(0.75)]
         return side_titles
 
-    def side_content(self, dfl) -> str:
+    def side_content(self, dfl: pd.DataFrame, is_outlier: np.ndarray) -> str:
         # TODO: extract side-content such as addresses etc..
-        side_content = "\n---\n".join(dfl[dfl.outliers == -1].text)
+        side_content = "\n---\n".join(dfl.text.values[is_outlier])
         return side_content
 
-    def normal_content(self, dfl) -> str:
+    def normal_content(self, dfl: pd.DataFrame, is_outlier: np.ndarray) -> str:
         # TODO: what does this function do, I forgot...
-        main_content = "\n---\n".join(dfl[dfl.outliers == 1].text)
+        main_content = "\n---\n".join(dfl.text.values[~is_outlier])
         return main_content
 
 
@@ -263,14 +359,18 @@ def get_template_elements(
         include_image: bool = False,
         vertical_elements=False
 ) -> pd.DataFrame:
-    elements = elements.loc[elements["type"] != document_base.ElementType.Graphic].copy()
+    # boolean indexing already returns a new frame, we only need an explicit
+    # copy where we assign to the result (the image placeholders below)
     if include_image:
+        elements = elements.loc[elements["type"] != document_base.ElementType.Graphic].copy()
         img_idxs = (elements["type"] == document_base.ElementType.Image)
         imgs = elements.loc[img_idxs]
         elements.loc[img_idxs, "rawtext"] = "{Image" + imgs.index.astype(str) + "}"
         elements = elements.loc[elements["rawtext"].str.len() > 1]
     else:
-        elements = elements.loc[elements["type"] != document_base.ElementType.Image].copy()
+        # filter out graphics and images in a single pass
+        elements = elements.loc[~elements["type"].isin(
+            (document_base.ElementType.Graphic, document_base.ElementType.Image))]
 
     if page_num:
         elements = elements.loc[elements.p_num == page_num]
@@ -295,30 +395,35 @@ def get_area_context(
     # we can more easily query the page with LLMs
 
     # get text elements around the table
-    el_df = get_template_elements(elements=pd.DataFrame(elements), page_num=page_num, include_image=False)
+    el_df = get_template_elements(elements=_as_dataframe(elements), page_num=page_num, include_image=False)
 
     # include boundingbox around table + context
     le = cluster_utils.boundarybox_query(
         el_df, bbox,
         tol=context_margin
-    ).copy()
+    )
 
     # and remove elements inside area
     le = cluster_utils.boundarybox_query(
         le, bbox,
         tol=0, exclude=True
-    ).copy()
-
-    area_box = pd.DataFrame(bbox.reshape(1, -1), columns=["x0", "y0", "x1", "y1"])
-    area_box["text"] = place_holder_template.format(placeholder)
+    )
 
     # TODO:  just use the normal "document-elements" for this instead of creating a fake
     #       area element
-    boxes = pd.DataFrame(text_boxes_from_elements(le)["text_box_elements"])
-    boxes = pd.concat([boxes.reset_index(), area_box], ignore_index=True).sort_values(
-        by=["y0", "x0"], ascending=[False, True])
+    # we only need the position and text of the boxes, so there is
+    # no need to create DocumentElements for them
+    if le.empty:
+        # boundarybox_query returns a frame without any columns if there is nothing to search
+        boxes = []
+    else:
+        bg = _group_text_boxes(le)
+        boxes = list(zip(bg.y0.tolist(), bg.x0.tolist(), bg.text.tolist()))
+    boxes.append((bbox[1], bbox[0], place_holder_template.format(placeholder)))
+    # sort from top to bottom and left to right
+    boxes.sort(key=lambda b: (-b[0], b[1]))
 
-    table_context = "\n\n".join(boxes["text"].to_list())
+    table_context = "\n\n".join(b[2] for b in boxes)
     return table_context
 
 
@@ -331,7 +436,10 @@ class PDFDocumentObjects(pydoxtools.operators_base.Operator):
             valid_tables,
             elements: pd.DataFrame
     ) -> list[document_base.DocumentElement]:
-        elements_df = get_template_elements(pd.DataFrame(elements), include_image=False)
+        elements_by_type: dict[document_base.ElementType, list[document_base.DocumentElement]] = {}
+        for e in elements:
+            elements_by_type.setdefault(e.type, []).append(e)
+        elements_df = get_template_elements(document_base.elements_to_dataframe(elements), include_image=False)
 
         table_elements = []
         for table_num, table in enumerate(valid_tables):
@@ -354,7 +462,7 @@ class PDFDocumentObjects(pydoxtools.operators_base.Operator):
             # get indices from table
             le = cluster_utils.boundarybox_query(
                 page_elements, table.bbox, tol=0
-            ).copy()
+            )
             # and remove from our elements
             elements_df = elements_df.drop(le.index.tolist())
             # elements = elements[]
@@ -374,20 +482,21 @@ class PDFDocumentObjects(pydoxtools.operators_base.Operator):
 
         # now do the textboxes
         txtboxes = text_boxes_from_elements(
-            [e for e in elements if e.type == document_base.ElementType.Text]
+            elements_by_type.get(document_base.ElementType.Text, [])
         )["text_box_elements"]
-        more_textboxes = [e for e in elements if e.type == document_base.ElementType.TextBox]
-        txtboxes = pd.DataFrame(txtboxes + more_textboxes)
+        more_textboxes = elements_by_type.get(document_base.ElementType.TextBox, [])
+        txtboxes = document_base.elements_to_dataframe(txtboxes + more_textboxes)
         # TODO: filter textboxes for vertical lines...
         # right now we're simply filtering out textboxes with just a single letter...
-        txtboxes = txtboxes.loc[txtboxes.text.str.len() > 1].reset_index()
-        docel_fields = {f.name for f in fields(document_base.DocumentElement)}
+        txtboxes = txtboxes.loc[txtboxes.text.str.len() > 1].reset_index(drop=True)
         # make sure we only have rows that work in our dataclass
-        txtboxes = txtboxes.loc[:, txtboxes.columns.intersection(docel_fields)]
+        txtboxes = txtboxes.loc[:, txtboxes.columns.intersection(document_base.document_element_fields)]
 
+        # iterate over plain records, transposing the dataframe would create a new
+        # dataframe and an additional Series for every row
         objects = [document_base.DocumentElement(
-            **{**v, "place_holder_text": f"TextBox{v.boxnum}"}
-        ) for idx, v in txtboxes.T.items()]
+            **{**r, "place_holder_text": f"TextBox{r['boxnum']}"}
+        ) for r in txtboxes.to_dict('records')]
         # txtboxes = pd.concat([txtboxes.reset_index(), table_elements],
         #                     ignore_index=True).sort_values(by=["p_num", "y0"], ascending=[True, False])
 
@@ -403,17 +512,20 @@ class PageTemplateGenerator(pydoxtools.operators_base.Operator):
 
         def generate(exclude: list[str] | document_base.ElementType = None) -> dict[int, str]:
             exclude = list_utils.ensure_list(exclude)
-            objs = pd.DataFrame(document_objects)
+            objs = document_base.elements_to_dataframe(document_objects)
             if objs.empty:
                 return {}
-            objs = objs.sort_values(by=["p_num", "y0"], ascending=[True, False])
+            # sort by page and from top to bottom without going through pandas' sort machinery
+            objs = objs.iloc[np.lexsort((-objs.y0.to_numpy(dtype=float), objs.p_num.to_numpy()))]
             pages = objs.p_num.unique()
-            new_text = objs.apply(
-                lambda x: (place_holder_template.format(x.place_holder_text)
-                           if (x.type in exclude)
-                           else x.text),
-                axis=1)
-            page_templates = {p: "\n\n".join(new_text.dropna()[objs.p_num == p]) for p in pages}
+            new_text = pd.Series(np.where(
+                objs.type.isin(exclude),
+                objs.place_holder_text.map(place_holder_template.format),
+                objs.text
+            ), index=objs.index).dropna()
+            # join the texts of every page in one go and keep pages without any text
+            page_templates = new_text.groupby(objs.p_num, sort=False).agg("\n\n".join)
+            page_templates = page_templates.reindex(pages, fill_value="").to_dict()
             # page_templates = {p: "\n\n".join(objs[objs.p_num == p].text) for p in pages}
 
             # elements = elements.sort_values(by="y0")#.loc[(19,578)]
@@ -422,14 +534,38 @@ class PageTemplateGenerator(pydoxtools.operators_base.Operator):
         return generate
 
 
+def join_page_templates(
+        page_templates: typing.Callable[..., dict[int, str]],
+        pages: typing.Iterable[int],
+        exclude: list[str] | document_base.ElementType = None,
+        page_headers: bool = True
+) -> str:
+    """join the page templates of a document into a single text. The templates
+    get generated once for all pages."""
+    templates = page_templates(exclude=exclude)
+    if page_headers:
+        return "".join(f"\n\n-------- {p} --------\n\n{templates[p]}" for p in pages)
+    else:
+        return "".join(templates[p] for p in pages)
+
+
 def get_bbox_context(
-        bbox: tuple | np.ndarray, elements: list[pydoxtools.document_base.DocumentElement],
+        bbox: tuple | np.ndarray, elements: list[pydoxtools.document_base.DocumentElement] | pd.DataFrame,
         page_num: int,
         placeholder: str = "area"
 ):
     """Get the context of a table from the document"""
     table_context = get_area_context(
-        elements=pd.DataFrame(elements), bbox=bbox, page_num=page_num, context_margin=20,
+        elements=_as_dataframe(elements), bbox=bbox, page_num=page_num, context_margin=20,
         placeholder=placeholder
     )
     return table_context
+
+
+def get_tables_context(
+        tables: list, elements: list[pydoxtools.document_base.DocumentElement]
+) -> dict[int, str]:
+    """Get the context of every table from the document. The elements only
+    get converted into a dataframe once for all tables."""
+    elements_df = document_base.elements_to_dataframe(elements)
+    return {k: get_bbox_context(v.bbox, elements_df, v.page, "table") for k, v in enumerate(tables)}
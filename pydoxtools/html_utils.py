@@ -87,11 +87,18 @@ def strip_html(html):
     return cleaner.clean_html(html)
 
 
+# splits text at whitespace with at least two line breaks. Surrounding whitespace gets
+# stripped from the blocks afterwards: a pattern like r"\s*\n\s*\n\s*" backtracks
+# quadratically on the long whitespace runs which are common in html texts.
+_text_block_separator = re.compile(r"\n\s*\n")
+
+
 def get_text_only_blocks(html) -> list[str]:
     """
     extrac html text, remove most whitespace and split into textblock lists
     """
-    return re.split(r"\s*\n\s*\n\s*", bs(html).get_text("\n\n").strip())
+    text = bs(html).get_text("\n\n").strip()
+    return [block.strip() for block in _text_block_separator.split(text)]
 
 
 def get_pure_html_text(html):
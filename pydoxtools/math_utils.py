@@ -1,8 +1,38 @@
 from __future__ import annotations  # this is so, that we can use python3.10 annotations..
 
+import logging
+
 import numpy as np
 import sklearn as sk
 
+logger = logging.getLogger(__name__)
+
+try:
+    # numba is optional. We only use it to compile a couple of
+    # tight numerical loops.
+    import numba
+except ImportError:
+    logger.info("numba is not available, falling back to numpy implementations")
+    numba = None
+
+
+def optional_njit(**njit_kwargs):
+    """
+    Decorator which compiles a function using numba.njit if numba is
+    installed and leaves it untouched otherwise.
+
+    As the uncompiled versions of those functions are pure-python loops,
+    callers should check `math_utils.numba` and use a vectorized
+    numpy implementation in case it is not available.
+    """
+
+    def decorator(func):
+        if numba is None:
+            return func
+        return numba.njit(**njit_kwargs)(func)
+
+    return decorator
+
 
 # TODO: merge this with cluster_utils
 
@@ -28,10 +28,8 @@ import numpy as np
 import pandas as pd
 import sklearn as sk
 import sklearn.linear_model
-import torch
 from scipy.spatial.distance import pdist, squareform
 from tqdm import tqdm
-from transformers import AutoTokenizer, AutoModel, AutoModelForQuestionAnswering
 
 from pydoxtools.settings import settings
 
@@ -50,12 +48,28 @@ def str_similarity(a, b):
     return SequenceMatcher(None, a, b).ratio()
 
 
-device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
-logger.info(f"using {device}-device for nlp_operations!")
+# torch & transformers get imported inside the functions which need them. Importing
+# them takes seconds, which we don't want to pay when we never use a transformer model.
+@functools.lru_cache
+def get_device():
+    import torch
+
+    device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+    logger.info(f"using {device}-device for nlp_operations!")
+    return device
+
+
+def __getattr__(name):
+    # keep nlp_utils.device available without importing torch on module import
+    if name == "device":
+        return get_device()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @functools.lru_cache(maxsize=32)
 def load_tokenizer(model_id):
+    from transformers import AutoTokenizer
+
     logger.info("load_tokenizer")
     tokenizer = AutoTokenizer.from_pretrained(model_id)
     return tokenizer
@@ -63,6 +77,9 @@ def load_tokenizer(model_id):
 
 @functools.lru_cache
 def load_model(model_id: str) -> Any:
+    from transformers import AutoModel
+
+    device = get_device()
     logger.info(f"load model {model_id} on device: {device}")
     # model = AutoModelForQuestionAnswering.from_pretrained(model_id, output_hidden_states=True)
     model = AutoModel.from_pretrained(model_id, output_hidden_states=True)
@@ -159,6 +176,9 @@ def transform_to_contextual_embeddings(input_ids_t, model_id: str, tokenizer=Non
     """
     Create contextual embeddings using a huggingface model
     """
+    import torch
+
+    device = get_device()
     # for one sentence all ids are "1" for two, the first sentence gets "0"
     input_ids_t = torch.tensor([input_ids_t]).to(device)
     segments_ids_t = torch.tensor([[1] * input_ids_t.shape[1]]).to(device)
@@ -267,6 +287,8 @@ def longtxt_embeddings(
 
 # old name: create_cross_lingual_embeddings
 def create_cross_lingual_contextual_embeddings(txt: str, model_id: str, lang: bool = False):
+    import torch
+
     # Map the token strings to their vocabulary indeces.
     # indexed_tokens = tokenizer.convert_tokens_to_ids(toktxt)
     tokenizer = load_tokenizer(model_id=model_id)
@@ -468,6 +490,8 @@ def load_qa_models(model_id: str):
     logger.info(f"loading Q & A model and tokenizer {model_id}")
     # model, tokenizer = load_models(model_id)
     # TODO: use load_tokenizer function for this
+    from transformers import AutoModelForQuestionAnswering
+
     tokenizer = load_tokenizer(model_id)
     model = AutoModelForQuestionAnswering.from_pretrained(model_id)
     logger.info(f"finished loading Q & A models... {model_id}")
@@ -497,6 +521,8 @@ def summarize_long_text(
     text before using this summarizer. For example reducing the text size
     using a textrank algorithm which filters out unimportant sentences .
     """
+    import torch
+
     pipeline = load_pipeline("summarization", model_id=model_id)
     model, tokenizer = pipeline.model, pipeline.tokenizer
     max_input_tokens = get_model_max_len(model)
@@ -11,8 +11,6 @@ import functools
 import logging
 from typing import Dict, List, Tuple, Callable
 
-import torch
-
 from pydoxtools import nlp_utils
 from pydoxtools.list_utils import ensure_list
 from pydoxtools.nlp_utils import tokenize_windows
@@ -48,6 +46,8 @@ def get_topk_answers(answer_start_scores, answer_end_scores,
     # answer_start = torch.argmax(answer_start_scores)  # Get the most likely beginning of answer with the argmax of the score
     # answer_end = torch.argmax(answer_end_scores) + 1  # Get the most likely end of answer with the argmax of the score
 
+    import torch
+
     if ans_num > 5:
         raise NotImplementedError("k can not be > 5.")
     answers_start = torch.topk(answer_start_scores, k=5)
@@ -77,6 +77,8 @@ def get_topk_answers(answer_start_scores, answer_end_scores,
 
 
 def long_text_question(question, text, model_id: str):
+    import torch
+
     max_len = 512  # maximum possble input for BERT and other transformers
     model, tokenizer = nlp_utils.load_qa_models(model_id=model_id)
     q_inputs = tokenizer(question, add_special_tokens=False, return_tensors="pt")
@@ -77,6 +77,7 @@ class Operator(ABC, typing.Generic[OperatorReturnType]):
         # try to keep __init__ with no arguments for Operator..
         self._in_mapping: dict[str, str] = {}
         self._out_mapping: dict[str, str] = {}
+        self._pipeline_out_mapping: dict[str, str] = {}
         self._output_type: dict[str, Any] | Any = {}
         self._cache = False  # TODO: switch to "True" by default
         self._allow_disk_cache = True
@@ -180,6 +181,9 @@ class Operator(ABC, typing.Generic[OperatorReturnType]):
         #       variable names of the extractor?
         self._out_mapping = kwargs
         self._out_mapping.update({k: k for k in args})
+        # the reverse mapping (pipeline name -> operator output) gets computed once here,
+        # so that the pipeline doesn't have to remap the entire output for every call
+        self._pipeline_out_mapping = {v: k for k, v in self._out_mapping.items()}
         return self
 
     @property
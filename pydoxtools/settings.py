@@ -32,6 +32,9 @@ class _Settings(BaseSettings):
     PDX_ENABLE_DISK_CACHE: bool = False
     TRAINING_DATA_DIR: Path = _PYDOXTOOLS_DIR / 'training_data'
     PDX_MODEL_DIR = PDX_CACHE_DIR_BASE / "models"
+    # switch spacy to the GPU (if there is one) before the first model gets loaded.
+    # Set this to False to keep spacy on the CPU.
+    PDX_SPACY_PREFER_GPU: bool = True
 
     # in order to be able to access OPENAI api
     OPENAI_API_KEY: str = "sk ...."
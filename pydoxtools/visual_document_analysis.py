@@ -5,6 +5,7 @@ import hashlib
 import typing
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection, PolyCollection
 import numpy as np
 import pydantic
 
@@ -103,28 +104,32 @@ def plot_boxes(
             ax.set_ylim(bbox[y0], bbox[y1])
         plt.gca().set_aspect('equal', adjustable='box')  # set x & y scale the same
 
-    for i, box in enumerate(box_polygons):
-        if groups is not None:
-            color = color_from_string(groups[i])
-        elif layer_props.color == "random":
-            color = color_from_string(i)
-        else:
-            color = layer_props.color
-
-        if layer_props.filled:
-            ax.fill(
-                *box.T,
-                linewidth=layer_props.linewidth, alpha=layer_props.alpha,
-                linestyle=layer_props.linestyle, color=color
-            )
-        else:
-            ax.plot(
-                *box[[0, 1, 2, 3, 0]].T,
-                linewidth=layer_props.linewidth, alpha=layer_props.alpha,
-                linestyle=layer_props.linestyle, color=color
-            )
+    if groups is not None:
+        colors = [color_from_string(g) for g in groups]
+    elif isinstance(layer_props.color, str) and layer_props.color == "random":
+        colors = [color_from_string(i) for i in range(len(box_polygons))]
+    else:
+        colors = layer_props.color
+
+    # draw all boxes of a layer as a single collection instead of
+    # calling matplotlib for every single box
+    if layer_props.filled:
+        collection = PolyCollection(
+            box_polygons, facecolors=colors, edgecolors=colors,
+            linewidths=layer_props.linewidth, alpha=layer_props.alpha,
+            linestyles=layer_props.linestyle
+        )
+    else:
+        collection = LineCollection(
+            box_polygons[:, [0, 1, 2, 3, 0]], colors=colors,
+            linewidths=layer_props.linewidth, alpha=layer_props.alpha,
+            linestyles=layer_props.linestyle
+        )
+    ax.add_collection(collection)
+    ax.autoscale_view()
 
-        if layer_props.box_numbers:
+    if layer_props.box_numbers:
+        for i, box in enumerate(box_polygons):
             ax.text(*box[1], i, fontsize=5)
 
     return ax
@@ -0,0 +1,79 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
+import functools
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.cluster import hierarchy
+from scipy.spatial.distance import squareform
+
+from pydoxtools import cluster_utils as gu
+from pydoxtools.extract_tables import TableExtractionParameters
+
+
+def random_boxes(rng, n, max_size):
+    xy = rng.uniform(0, 500, size=(n, 2))
+    wh = rng.uniform(0, max_size, size=(n, 2))
+    return np.hstack([xy, xy + wh])
+
+
+def test_boundarybox_intersection_counts():
+    rng = np.random.default_rng(0)
+    bbs, areas = random_boxes(rng, 300, 20), random_boxes(rng, 50, 100)
+    df_bbs = pd.DataFrame(bbs, columns=gu.box_cols)
+    expected = [len(gu.boundarybox_intersection_query(bbs=df_bbs, bbox=area)) for area in areas]
+    assert gu.boundarybox_intersection_counts(bbs, areas).tolist() == expected
+    assert sum(expected) > 0
+    assert gu.boundarybox_intersection_counts(np.empty((0, 4)), areas).tolist() == [0] * len(areas)
+
+
+@pytest.mark.parametrize("param_level", [
+    *TableExtractionParameters.reduced_params().area_detection_distance_func_params,
+    {'va': [5.0, 50, 25, 50]},
+    {'ha': [5.0, 50, 25, 50]},
+])
+def test_alignement_candidate_pairs_clustering(param_level):
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 600, size=(400, 2))
+    boxes = np.hstack([xy, xy + rng.uniform(1, 60, size=(400, 2))])
+    distance_threshold = 10.0
+
+    pair_idx = gu.alignement_candidate_pairs(boxes, param_level, distance_threshold)
+    assert pair_idx is not None
+    # the candidates only need to be a small part of all pairs...
+    assert len(pair_idx[0]) < len(boxes) * (len(boxes) - 1) / 2
+    labels = gu.adjacency_cluster(gu.calc_pairwise_adjacency(
+        gu.pairwise_weighted_distance_combination, boxes,
+        distance_threshold=distance_threshold, parameter_list=param_level, pair_idx=pair_idx))
+
+    # ... but give the same groups as a clustering of all pairs
+    dist_func = functools.partial(gu.pairwise_weighted_distance_combination, parameter_list=param_level)
+    full_labels, _ = gu.distance_cluster(
+        data=boxes, distance_threshold=distance_threshold, pairwise_distance_func=dist_func)
+    # single linkage merges everything closer than (and not equal to) distance_threshold
+    reference_labels = hierarchy.fcluster(
+        hierarchy.linkage(squareform(gu.calc_pairwise_matrix(dist_func, boxes, diag=0)), method="single"),
+        t=np.nextafter(distance_threshold, 0), criterion="distance")
+    assert len(set(labels)) < len(boxes)
+    assert (pd.factorize(labels)[0] == pd.factorize(full_labels)[0]).all()
+    assert (pd.factorize(labels)[0] == pd.factorize(reference_labels)[0]).all()
+
+
+@pytest.mark.parametrize("param_level", [
+    {'va': [5.0, 50, 25, 50], 'ha': [5.0, 50, 25, 50]},
+    {'va': [5.0, 50, 25, 50]},
+])
+def test_pairwise_alignement_distance_kernel(param_level, monkeypatch):
+    rng = np.random.default_rng(0)
+    boxes = random_boxes(rng, 200, 30)
+    boxes[:10, 2:] = boxes[:10, :2]  # degenerate boxes without any size
+    boxes[10:15] = np.nan  # boxes with invalid coordinates
+    pair_idx = gu.lower_triangle_indices_cached(len(boxes))
+    distance_threshold = 10.0
+
+    kernel_connected = gu.pairwise_weighted_distance_combination(boxes, pair_idx, param_level) < distance_threshold
+    monkeypatch.setattr(gu.math_utils, "numba", None)
+    numpy_d = gu.pairwise_weighted_distance_combination(boxes, pair_idx, param_level)
+    assert kernel_connected.any()
+    assert (kernel_connected == (numpy_d < distance_threshold)).all()
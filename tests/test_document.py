@@ -0,0 +1,92 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
+import concurrent.futures
+import io
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from pydoxtools.document import (Document, DocumentTypeError, calculate_a_d_ratio, count_words, get_http_session,
+                                 may_be_path, short_repr)
+from pydoxtools.settings import settings
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_many(executor, monkeypatch):
+    # with the disk cache, results would be stored on disk instead of in the document
+    monkeypatch.setattr(settings, "PDX_ENABLE_DISK_CACHE", False)
+    sources = [f"document number {i}\n\nwith a second paragraph." for i in range(5)]
+    outputs = ("full_text", "text_segments")
+    docs = Document.load_many(
+        sources, outputs=outputs, max_workers=2, executor=executor, document_type="string")
+    assert len(docs) == len(sources)
+    for source, doc in zip(sources, docs):
+        # cached outputs were calculated in the workers and come back in the cache
+        assert doc.x_funcs["text_segments"] in doc._cache
+        assert doc.full_text == source
+        assert doc.text_segments == Document(source, document_type="string").text_segments
+
+
+@pytest.mark.parametrize("text", [
+    "", " ", "\n\n\t", "word", " two  words ", "a b c\u3000d",
+    "line break\x1cand\x85more", "über naïve 数据 🚀 \U0001F600x", "tab\tseparated\r\nlines\x0b\x0c",
+    "non\xa0breaking\u2028line\u2003em\u3000space",
+])
+def test_count_words(text):
+    assert count_words(text) == len(text.split())
+
+
+@pytest.mark.parametrize("text", [
+    "", "   ", "abc", "123", "ab12", "@[`{ ~/:",
+    "Straße 12", "数据 ٣٤٥", "über² ½ naïve ١٢", "ⅷ ① 𝟘 𝐀",
+])
+def test_calculate_a_d_ratio(text):
+    # reference implementation with python's unicode-aware str methods
+    alphas = sum(c.isalpha() for c in text)
+    digits = sum(c.isdigit() for c in text if not c.isalpha())
+    expected = alphas / (alphas + digits) if alphas or digits else 0.5
+    assert calculate_a_d_ratio(text) == pytest.approx(expected)
+
+
+def test_http_session_per_thread():
+    session = get_http_session()
+    assert get_http_session() is session
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        thread_sessions = list(pool.map(lambda _: get_http_session(), range(2)))
+    assert all(s is not session for s in thread_sessions)
+
+
+def test_short_repr():
+    assert short_repr("a long text source", max_len=6) == "source"
+    assert short_repr(b"some bytes", max_len=5) == "b'bytes'"
+    assert short_repr(Path("/some/dir/file.pdf")) == str(Path("/some/dir/file.pdf"))
+    assert short_repr(io.BytesIO(b"content")) == "BytesIO"
+    with tempfile.NamedTemporaryFile() as f:
+        assert short_repr(f) == f.name
+
+
+def test_may_be_path():
+    assert may_be_path(Path("file.pdf"))
+    assert may_be_path("some/dir/file.pdf")
+    assert not may_be_path("a text\nwith several lines")
+    assert not may_be_path("x" * 5000)
+
+
+def test_document_type_detection_errors():
+    closed = io.BytesIO(b"content")
+    closed.close()
+    with pytest.raises(DocumentTypeError, match="could not detect the type of document: BytesIO") as e:
+        Document(closed).document_type_detection()
+    assert isinstance(e.value.__cause__, ValueError)
+
+    class UnknownDocument(Document):
+        @property
+        def _document_type_detection(self):
+            raise DocumentTypeError("unknown document type")
+
+    # type errors from the detection itself are not wrapped into another one
+    with pytest.raises(DocumentTypeError) as e:
+        UnknownDocument("text", document_type="string").document_type_detection()
+    assert str(e.value) == "unknown document type"
+    assert e.value.__cause__ is None
@@ -0,0 +1,32 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
+import pandas as pd
+import pytest
+
+from pydoxtools.document_base import DocumentElement, ElementType, elements_to_dataframe
+
+
+def mixed_elements():
+    return [DocumentElement(type=t, p_num=p, x0=0.0, y0=float(i), x1=10.0, y1=i + 10.0, text=f"{t.name} {i}")
+            for p in (1, 2) for i, t in enumerate(list(ElementType) * 2)]
+
+
+@pytest.mark.parametrize("types", [
+    [ElementType.Table], [ElementType.Graphic, ElementType.Image], [ElementType.Table, "all"],
+    ["all"], ["Table"], [None], [],
+])
+def test_filter_elements_by_type(types):
+    df = elements_to_dataframe(mixed_elements())
+    # the type column used to be a plain object column of ElementType members
+    df_object = df.astype({"type": object})
+    assert isinstance(df["type"].dtype, pd.CategoricalDtype)
+
+    pd.testing.assert_frame_equal(
+        df.loc[df["type"].isin(types)].astype({"type": object}),
+        df_object.loc[df_object["type"].isin(types)])
+    pd.testing.assert_frame_equal(
+        df.loc[~df["type"].isin(types)].astype({"type": object}),
+        df_object.loc[~df_object["type"].isin(types)])
+    for t in list(ElementType) + ["Table"]:
+        assert (df["type"] == t).tolist() == (df_object["type"] == t).tolist()
+        assert (df["type"] != t).tolist() == (df_object["type"] != t).tolist()
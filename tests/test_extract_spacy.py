@@ -0,0 +1,64 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
+import numpy as np
+import spacy
+
+from pydoxtools.document import Document
+from pydoxtools import extract_spacy
+from pydoxtools.extract_spacy import load_cached_spacy_model, spacy_vectorizer
+from pydoxtools.settings import settings
+
+
+def test_load_spacy_model_without_torch():
+    # loading a spacy model must not depend on torch being installed
+    nlp = load_cached_spacy_model("blank:en")
+    assert [t.text for t in nlp("a short text")] == ["a", "short", "text"]
+
+
+def test_batch_spacy_equals_spacy_doc():
+    texts = [
+        "A first paragraph.\n\nAnd a second one\nwith two lines.\n\n\nThird paragraph.",
+        "Just a single paragraph.",
+        "Another document.\n\nWith more paragraphs.",
+    ]
+    config = dict(spacy_model="blank:en")
+    batched = Document.batch_spacy(
+        [Document(t, document_type="string", configuration=config) for t in texts])
+    for text, bdoc in zip(texts, batched):
+        sdoc = Document(text, document_type="string", configuration=config).x("spacy_doc")
+        assert bdoc.x("spacy_doc").text == sdoc.text == text
+        assert [(t.text, t.whitespace_, t.is_sent_start) for t in bdoc.x("spacy_doc")] \
+               == [(t.text, t.whitespace_, t.is_sent_start) for t in sdoc]
+        assert [(e.text, e.label_) for e in bdoc.x("spacy_doc").ents] == [(e.text, e.label_) for e in sdoc.ents]
+
+
+def test_spacy_vectorizer_returns_copies():
+    nlp = spacy.blank("en")
+    nlp.vocab.set_vector("word", np.ones(3, dtype=np.float32))
+    vectorize = spacy_vectorizer(nlp)
+    vec = vectorize("word")
+    vec /= 2
+    np.testing.assert_array_equal(vectorize("word"), np.ones(3))
+
+
+def test_spacy_device_initialization(monkeypatch):
+    calls = []
+    monkeypatch.setattr(spacy, "prefer_gpu", lambda: calls.append(1) or False)
+
+    # a CPU-only caller can opt out of touching the global spacy device
+    monkeypatch.setattr(settings, "PDX_SPACY_PREFER_GPU", False)
+    extract_spacy.init_spacy_device.cache_clear()
+    load_cached_spacy_model.cache_clear()
+    load_cached_spacy_model("blank:en")
+    load_cached_spacy_model("blank:de")
+    assert calls == []
+
+    # otherwise the device gets switched only once, not on every model load
+    monkeypatch.setattr(settings, "PDX_SPACY_PREFER_GPU", True)
+    extract_spacy.init_spacy_device.cache_clear()
+    load_cached_spacy_model.cache_clear()
+    load_cached_spacy_model("blank:en")
+    load_cached_spacy_model("blank:de")
+    assert calls == [1]
+    extract_spacy.init_spacy_device.cache_clear()
+    load_cached_spacy_model.cache_clear()
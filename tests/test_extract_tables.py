@@ -0,0 +1,120 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
+import numpy as np
+import pandas as pd
+
+from pydoxtools import extract_tables
+from pydoxtools.cluster_utils import box_cols
+from pydoxtools.document import Document
+from pydoxtools.document_base import DocumentElement, ElementType
+from pydoxtools.extract_tables import TableExtractionParameters
+
+
+def table_grid_elements(p_num=1):
+    """a grid of text cells with a frame around each of them which should get merged into table areas"""
+    xy = [(float(x), float(y)) for x in range(50, 400, 70) for y in range(100, 400, 20)]
+    line_elements = [DocumentElement(
+        type=ElementType.Text, p_num=p_num, x0=x, y0=y, x1=x + 40, y1=y + 10, rawtext="cell", boxnum=i)
+        for i, (x, y) in enumerate(xy)]
+    graphic_elements = [DocumentElement(
+        type=ElementType.Graphic, p_num=p_num, x0=x - 5, y0=y - 5, x1=x + 45, y1=y + 15) for x, y in xy]
+    return graphic_elements, line_elements
+
+
+def text_free_areas():
+    """graphic areas which don't contain any text"""
+    df_le = pd.DataFrame([[400., 400., 450., 410.]], columns=box_cols)
+    xy = np.array([(x, y) for x in range(50, 200, 30) for y in range(50, 200, 30)], dtype=float)
+    df_ge = pd.DataFrame(np.hstack([xy, xy + 30]), columns=box_cols)
+    return df_le, df_ge
+
+
+def test_table_areas_unchanged_by_default():
+    tbe = TableExtractionParameters.reduced_params()
+    df_le, df_ge = text_free_areas()
+    table_groups, box_levels = extract_tables.detect_table_area_candidates(
+        tbe, df_le, df_ge, distance_threshold=10.0)
+    # the table candidates are all areas of the last merge level which
+    # pass the size filters, no matter whether they contain text or not
+    expected = extract_tables._filter_boxes(
+        box_levels[-1].copy(), min_area=tbe.min_table_area,
+        min_aspect_ratio=tbe.min_aspect_ratio, max_aspect_ratio=tbe.max_aspect_ratio
+    ).sort_values(by=["y1", "x0", "y0", "x1"], ascending=[False, True, False, True])
+    assert not table_groups.empty
+    pd.testing.assert_frame_equal(table_groups, expected)
+
+
+def test_table_areas_without_text():
+    df_le, df_ge = text_free_areas()
+    table_groups, box_levels = extract_tables.detect_table_area_candidates(
+        TableExtractionParameters.reduced_params(), df_le, df_ge, distance_threshold=10.0,
+        filter_empty_areas=True)
+    assert table_groups.empty
+    assert len(box_levels) > 0
+
+
+def test_table_area_text_filter_configuration():
+    graphic_elements, line_elements = table_grid_elements()
+    extractor = extract_tables.TableCandidateAreasExtractor()
+    args = (graphic_elements, line_elements, {1: (0, 0, 600, 800)}, line_elements)
+    # areas with text are table candidates, with and without the filter
+    default = [tuple(t._initial_area) for t in extractor(*args)["table_candidates"]]
+    filtered = [tuple(t._initial_area) for t in extractor(*args, filter_empty_areas=True)["table_candidates"]]
+    assert default
+    assert default == filtered
+    assert Document(b"%PDF", document_type="application/pdf").x("table_area_text_filter") is False
+
+
+def test_table_area_candidates_keep_float64():
+    graphic_elements, line_elements = table_grid_elements()
+    res = extract_tables.TableCandidateAreasExtractor().use_pdf_source(
+        graphic_elements, line_elements, {1: (0, 0, 600, 800)}, line_elements)
+
+    assert res["table_candidates"]
+    for table in res["table_candidates"]:
+        assert table._initial_area.dtype == np.float64
+    for df in res["box_levels"][1]:
+        assert (df[box_cols].dtypes == np.float64).all()
+
+
+def test_cached_table_areas_are_copies():
+    xy = np.array([(x, y) for x in range(50, 400, 70) for y in range(100, 400, 20)], dtype=float)
+    df_le = pd.DataFrame(np.hstack([xy, xy + [40, 10]]), columns=box_cols)
+    df_ge = pd.DataFrame(np.hstack([xy - 5, xy + [45, 15]]), columns=box_cols)
+    args = (TableExtractionParameters.reduced_params(), df_le, df_ge, 10.0)
+
+    table_groups, box_levels = extract_tables.detect_table_area_candidates_cached(*args)
+    expected = extract_tables.detect_table_area_candidates(*args)
+    # modifying the results must not change the cached areas
+    table_groups["x0"] = -1.0
+    for boxes in box_levels:
+        boxes["x0"] = -1.0
+    table_groups, box_levels = extract_tables.detect_table_area_candidates_cached(*args)
+    pd.testing.assert_frame_equal(table_groups, expected[0])
+    assert len(box_levels) == len(expected[1])
+    for boxes, expected_boxes in zip(box_levels, expected[1]):
+        pd.testing.assert_frame_equal(boxes, expected_boxes)
+
+
+def test_table_area_workers():
+    graphic_elements, line_elements = [], []
+    for p in (1, 2, 3):
+        ge, le = table_grid_elements(p_num=p)
+        graphic_elements += ge
+        line_elements += le
+    pages_bbox = {p: (0, 0, 600, 800) for p in (1, 2, 3)}
+    extractor = extract_tables.TableCandidateAreasExtractor()
+    serial = extractor.use_pdf_source(
+        graphic_elements, line_elements, pages_bbox, line_elements, max_workers=1)
+    parallel = extractor.use_pdf_source(
+        graphic_elements, line_elements, pages_bbox, line_elements, max_workers=2)
+
+    # detecting the areas in worker processes has to give the same areas as the serial path
+    assert serial["table_candidates"]
+    assert [(t.page, tuple(t._initial_area)) for t in serial["table_candidates"]] \
+           == [(t.page, tuple(t._initial_area)) for t in parallel["table_candidates"]]
+    assert serial["box_levels"].keys() == parallel["box_levels"].keys() == {1, 2, 3}
+    for p, box_levels in serial["box_levels"].items():
+        assert len(box_levels) == len(parallel["box_levels"][p])
+        for boxes, parallel_boxes in zip(box_levels, parallel["box_levels"][p]):
+            pd.testing.assert_frame_equal(boxes, parallel_boxes)
@@ -0,0 +1,152 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
+import types
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pydoxtools import extract_textstructure
+from pydoxtools.document import Document
+from pydoxtools.document_base import DocumentElement, ElementType, Font, elements_to_dataframe
+from pydoxtools.extract_textstructure import TitleExtractor, place_holder_template
+
+test_dir_path = Path(__file__).parent.absolute()
+
+
+def test_group_elements_without_lines():
+    bg = extract_textstructure.group_elements(
+        elements_to_dataframe([]), ["p_num", "boxnum"], agg="boxes_from_lines_w_bb")
+    assert bg.empty
+    assert list(bg.columns) == ["x0", "y0", "x1", "y1", "text"]
+
+
+def test_text_boxes_without_lines():
+    assert extract_textstructure.text_boxes_from_elements([]) == dict(text_box_elements=[])
+
+    # an area without any text around it only consists of its placeholder
+    line = DocumentElement(
+        type=ElementType.Text, p_num=1, x0=400.0, y0=700.0, x1=500.0, y1=710.0,
+        rawtext="far away", boxnum=0, mean_char_orientation=0.0)
+    assert extract_textstructure.get_bbox_context((0.0, 0.0, 100.0, 100.0), [line], 1) == "{area}"
+    assert extract_textstructure.get_bbox_context((0.0, 0.0, 100.0, 100.0), [line], 2) == "{area}"
+
+
+def test_title_extraction_is_deterministic():
+    lines = []
+    for i in range(80):
+        title = i % 20 == 0
+        lines.append(DocumentElement(
+            type=ElementType.Text, p_num=i // 40 + 1,
+            x0=50. + (i % 7), y0=800. - (i % 40) * 18, x1=300. + (i % 11) * 20, y1=810. - (i % 40) * 18,
+            rawtext=f"Chapter {i}" if title else f"some ordinary text in line number {i} of the page",
+            font_infos={Font(name="Bold" if title else "Regular", size=18. if title else 10., color="black")},
+            linenum=i, boxnum=i // 5, mean_char_orientation=0.0, obj=i))
+    assert len(lines) >= TitleExtractor.min_lines_for_outlier_detection
+
+    first, second = TitleExtractor()(lines), TitleExtractor()(lines)
+    assert first["titles"] == second["titles"]
+    assert first["titles"]
+    assert first["main_content"] == second["main_content"]
+
+
+def test_group_elements_unknown_aggregation():
+    with pytest.raises(ValueError, match="unknown aggregation"):
+        extract_textstructure.group_elements(elements_to_dataframe([]), ['p_num', 'boxnum'], agg="not_there")
+
+
+def test_pages():
+    doc = types.SimpleNamespace(full_text=" ".join(f"w{i}" for i in range(1200)))
+    pages = extract_textstructure.pages(doc)
+    assert [len(p) for p in pages] == [500, 500, 200]
+    assert pages[1][0] == "w500"
+    page_texts = extract_textstructure.page_texts(doc)
+    assert page_texts == [" ".join(p) for p in pages]
+    assert extract_textstructure.page_texts(types.SimpleNamespace(full_text="")) == []
+
+
+def baseline_page_templates(document_objects, exclude=None):
+    """the original row-wise page template generation"""
+    exclude = extract_textstructure.list_utils.ensure_list(exclude)
+    objs = pd.DataFrame(document_objects)
+    if objs.empty:
+        return {}
+    objs = objs.sort_values(by=["p_num", "y0"], ascending=[True, False])
+    new_text = objs.apply(
+        lambda x: (place_holder_template.format(x.place_holder_text)
+                   if (x.type in exclude)
+                   else x.text),
+        axis=1)
+    return {p: "\n\n".join(new_text.dropna()[objs.p_num == p]) for p in objs.p_num.unique()}
+
+
+def baseline_page_templates_str(document_objects, pages):
+    return "".join(f"\n\n-------- {p} --------\n\n" + baseline_page_templates(document_objects)[p]
+                   for p in pages)
+
+
+def page_template_objects():
+    """text boxes & tables on several pages, out of order and with identical y-positions"""
+    objs = []
+    for p in (3, 1, 2):
+        for i, y0 in enumerate((100.0, 500.0, 300.0, 500.0)):
+            objs.append(DocumentElement(
+                type=ElementType.TextBox, p_num=p, x0=10.0 * i, y0=y0, x1=100.0, y1=y0 + 10,
+                text=f"text {p}-{i}", place_holder_text=f"TextBox{p}{i}"))
+        objs.append(DocumentElement(
+            type=ElementType.Table, p_num=p, x0=0.0, y0=200.0, x1=100.0, y1=250.0,
+            text=f"table {p}", place_holder_text=f"Table{p}"))
+    # an object without any text and a page with only that object
+    objs.append(DocumentElement(type=ElementType.Image, p_num=2, x0=0.0, y0=400.0, x1=10.0, y1=410.0))
+    objs.append(DocumentElement(type=ElementType.Image, p_num=4, x0=0.0, y0=400.0, x1=10.0, y1=410.0))
+    return objs
+
+
+@pytest.mark.parametrize("exclude", [
+    None, "all", ElementType.Table, [ElementType.Table, ElementType.TextBox], [ElementType.Image]
+])
+def test_page_templates_unchanged(exclude):
+    objs = page_template_objects()
+    generate = extract_textstructure.PageTemplateGenerator()(objs)
+    templates = generate(exclude=exclude)
+    assert templates == baseline_page_templates(objs, exclude=exclude)
+    assert list(templates) == [1, 2, 3, 4]
+    assert extract_textstructure.join_page_templates(generate, [1, 2, 3, 4]) \
+           == baseline_page_templates_str(objs, [1, 2, 3, 4])
+    assert extract_textstructure.PageTemplateGenerator()([])(exclude=exclude) == {}
+
+
+def test_page_template_placeholders():
+    objs = page_template_objects()
+    templates = extract_textstructure.PageTemplateGenerator()(objs)(exclude=ElementType.Table)
+    for p in (1, 2, 3):
+        assert place_holder_template.format(f"Table{p}") in templates[p]
+        assert f"table {p}" not in templates[p]
+
+
+def test_pdf_page_templates_unchanged():
+    doc = Document(test_dir_path / "data/List of North American countries by population - Wikipedia.pdf")
+    pages = sorted(doc.x("page_set"))
+    assert len(pages) > 1
+    document_objects = doc.x("document_objects")
+    assert doc.x("page_templates")() == baseline_page_templates(document_objects)
+    assert doc.x("page_templates_str") == baseline_page_templates_str(document_objects, doc.x("page_set"))
+    for exclude in (ElementType.Table, [ElementType.Table, ElementType.TextBox]):
+        assert doc.x("page_templates")(exclude=exclude) \
+               == baseline_page_templates(document_objects, exclude=exclude)
+
+
+@pytest.mark.parametrize("include_image", [False, True])
+def test_template_elements_with_categorical_types(include_image):
+    elements = [DocumentElement(
+        type=t, p_num=p, x0=0.0, y0=float(i), x1=10.0, y1=i + 10.0, rawtext=f"{t.name} {i}",
+        mean_char_orientation=90.0 if i == 5 else 0.0)
+        for p in (1, 2) for i, t in enumerate(list(ElementType) * 2)]
+    df = elements_to_dataframe(elements)
+    df_object = df.astype({"type": object})
+    for page_num in (None, 2):
+        res = extract_textstructure.get_template_elements(df, page_num=page_num, include_image=include_image)
+        expected = extract_textstructure.get_template_elements(
+            df_object, page_num=page_num, include_image=include_image)
+        assert not res.empty
+        pd.testing.assert_frame_equal(res.astype({"type": object}), expected)
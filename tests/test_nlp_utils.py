@@ -0,0 +1,19 @@
+from __future__ import annotations  # this is so, that we can use python3.10 annotations..
+
+import subprocess
+import sys
+
+
+def test_import_without_torch():
+    # torch & transformers should only get imported when a model is actually used
+    code = (
+        "import sys\n"
+        "import pydoxtools\n"
+        "import pydoxtools.extract_classes\n"
+        "import pydoxtools.nlp_utils\n"
+        "import pydoxtools.operator_huggingface\n"
+        "assert 'torch' not in sys.modules, 'torch was imported'\n"
+        "assert 'transformers' not in sys.modules, 'transformers was imported'\n"
+    )
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert res.returncode == 0, res.stderr